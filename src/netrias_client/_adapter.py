@@ -41,6 +41,10 @@ REQUIRED_RECORD_KEYS: tuple[str, ...] = tuple(
 and the validator cannot drift from the declared contract.
 """
 
+_REQUIRED_RECORD_KEY_SET: Final[frozenset[str]] = frozenset(REQUIRED_RECORD_KEYS)
+"""'why': one subset check per entry on the common (complete) path; the ordered
+tuple is only walked when something is missing and a message must be built."""
+
 
 def build_column_mapping_payload(
     result: MappingDiscoveryResult,
@@ -67,15 +71,12 @@ def _build_manifest_entries(
     """
 
     entries: list[ColumnMappingRecord | None] = [None] * column_count
-    matched_names: list[str] = []
     for suggestion in suggestions:
         placement = _place_suggestion(suggestion, threshold, column_count)
-        if placement is None:
-            continue
-        column_id, entry = placement
-        entries[column_id] = entry
-        matched_names.append(suggestion.source_column)
-    _log_manifest_outcome(logger, matched_names)
+        if placement is not None:
+            column_id, entry = placement
+            entries[column_id] = entry
+    _log_manifest_outcome(logger, entries)
     return entries
 
 
@@ -84,9 +85,11 @@ def _place_suggestion(
 ) -> tuple[int, ColumnMappingRecord] | None:
     """'why': drop the whole slot if the top option lacks target_cde_id so the
     non-None entry invariant (cde_key + cde_id both populated) holds downstream.
+    Columns with no matches at all (common for free-text columns) exit before any
+    option scan.
     """
     column_id = suggestion.column_id
-    if column_id is None or not 0 <= column_id < column_count:
+    if column_id is None or not suggestion.options or not 0 <= column_id < column_count:
         return None
     option = _top_option(suggestion.options, threshold)
     if option is None or option.target is None or option.target_cde_id is None:
@@ -112,11 +115,12 @@ def _make_entry(
     }
 
 
-def _log_manifest_outcome(logger: logging.Logger, matched_names: list[str]) -> None:
-    if matched_names:
-        logger.info("adapter manifest entries: %s", matched_names)
-    else:
+def _log_manifest_outcome(logger: logging.Logger, entries: list[ColumnMappingRecord | None]) -> None:
+    """'why': the matched-name list is only worth building when INFO is actually emitted."""
+    if all(entry is None for entry in entries):
         logger.warning("adapter manifest entries empty after filtering")
+    elif logger.isEnabledFor(logging.INFO):
+        logger.info("adapter manifest entries: %s", [entry["column_name"] for entry in entries if entry])
 
 
 def _format_alternatives(
@@ -143,17 +147,15 @@ def _format_alternative(option: MappingRecommendationOption) -> AlternativeEntry
 def _top_option(
     options: tuple[MappingRecommendationOption, ...], threshold: float
 ) -> MappingRecommendationOption | None:
-    eligible = [opt for opt in options if _meets_threshold(opt, threshold)]
-    if not eligible:
-        return None
-    return max(eligible, key=lambda opt: cast(float, opt.confidence))
-
-
-def _meets_threshold(option: MappingRecommendationOption, threshold: float) -> bool:
-    score = option.confidence
-    if score is None:
-        return False
-    return score >= threshold
+    """'why': single streaming pass; strict `>` keeps the first option on ties,
+    matching the previous filter-then-max behaviour."""
+    best: MappingRecommendationOption | None = None
+    best_score = threshold
+    for option in options:
+        score = option.confidence
+        if score is not None and score >= best_score and (best is None or score > best_score):
+            best, best_score = option, score
+    return best
 
 
 def load_manifest(path: Path) -> Mapping[str, object]:
@@ -238,8 +240,8 @@ def _coerce_entry(entry: object, index: int) -> ColumnMappingRecord | None:
     if not isinstance(entry, Mapping):
         raise MappingValidationError(_wrong_type_message(entry, index))
     typed_entry = cast(Mapping[str, object], entry)
-    missing = [key for key in REQUIRED_RECORD_KEYS if key not in typed_entry]
-    if missing:
+    if not _REQUIRED_RECORD_KEY_SET <= typed_entry.keys():
+        missing = [key for key in REQUIRED_RECORD_KEYS if key not in typed_entry]
         raise MappingValidationError(_missing_keys_message(typed_entry, missing, index))
     _validate_entry_value_types(typed_entry, index)
     return cast(ColumnMappingRecord, cast(object, dict(typed_entry)))
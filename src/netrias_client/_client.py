@@ -7,8 +7,7 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections.abc import Mapping
-from dataclasses import replace
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from uuid import uuid4
 
@@ -16,9 +15,11 @@ from ._async_utils import run_sync
 from ._config import Environment, build_settings
 from ._core import harmonize_async as _harmonize_async
 from ._data_model_store import (
+    clear_lookup_cache as _clear_lookup_cache,
     get_pv_set_async as _get_pv_set_async,
     list_cdes_async as _list_cdes_async,
     list_data_models_async as _list_data_models_async,
+    validate_values_async as _validate_values_async,
 )
 from ._discovery import discover_mapping_from_tabular_async as _discover_mapping_from_tabular_async
 from ._logging import LOGGER_NAMESPACE, configure_logger
@@ -67,6 +68,9 @@ class NetriasClient:
         discovery_url: str | None = None,
         harmonization_url: str | None = None,
         data_model_store_url: str | None = None,
+        pv_cache_directory: Path | str | None = None,
+        discovery_bypass_batch_size: int | None = None,
+        http2: bool | None = None,
     ) -> None:
         """Update settings; unspecified parameters preserve their current value."""
 
@@ -94,6 +98,13 @@ class NetriasClient:
             harmonization_url=harmonization_url if harmonization_url is not None else current.harmonization_url,
             data_model_store_url=data_model_store_url if data_model_store_url is not None else current_dms_url,
             environment=self._environment,
+            pv_cache_directory=pv_cache_directory if pv_cache_directory is not None else current.pv_cache_directory,
+            discovery_bypass_batch_size=(
+                discovery_bypass_batch_size
+                if discovery_bypass_batch_size is not None
+                else current.discovery_bypass_batch_size
+            ),
+            http2=http2 if http2 is not None else current.http2,
         )
         logger = configure_logger(
             self._logger_name,
@@ -106,9 +117,10 @@ class NetriasClient:
 
     @property
     def settings(self) -> Settings:
-        """Return a defensive copy of the current settings.
+        """Return the current settings snapshot.
 
-        'why': aid observability without exposing internal state for mutation
+        'why': `Settings` is frozen, so the stored instance is safe to share; `configure()`
+        swaps in a new object rather than mutating this one
         """
 
         return self._snapshot_settings()
@@ -351,9 +363,38 @@ class NetriasClient:
             )
         )
 
+    async def validate_values_bulk_async(
+        self,
+        checks: Sequence[tuple[str, str, str, str]],
+    ) -> tuple[bool, ...]:
+        """Validate many `(value, model_key, version, cde_key)` checks, fetching each PV set once.
+
+        Results are returned in the same order as `checks`.
+        """
+
+        settings = self._snapshot_settings()
+        return await _validate_values_async(settings=settings, checks=checks)
+
+    def validate_values_bulk(
+        self,
+        checks: Sequence[tuple[str, str, str, str]],
+    ) -> tuple[bool, ...]:
+        """Sync delegate for :meth:`validate_values_bulk_async`."""
+
+        return run_sync(self.validate_values_bulk_async(checks=checks))
+
+    def clear_dms_cache(self) -> None:
+        """Drop memoized CDE lists and PV sets so the next lookup refetches.
+
+        The cache is shared by every client in the process and keyed by Data Model
+        Store URL and API key, so clearing it affects all clients.
+        """
+
+        _clear_lookup_cache()
+
     def _snapshot_settings(self) -> Settings:
         with self._lock:
-            return replace(self._settings)
+            return self._settings
 
     def _snapshot_context(self) -> OperationContext:
         """Return an atomic snapshot of settings and logger.
@@ -363,6 +404,6 @@ class NetriasClient:
 
         with self._lock:
             return OperationContext(
-                settings=replace(self._settings),
+                settings=self._settings,
                 logger=self._logger,
             )
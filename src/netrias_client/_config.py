@@ -4,6 +4,7 @@
 """
 from __future__ import annotations
 
+import importlib.util
 from enum import Enum
 from pathlib import Path
 from typing import Final
@@ -47,6 +48,8 @@ DATA_MODEL_STORE_BASE_URL = "https://85fnwlcuc2.execute-api.us-east-2.amazonaws.
 BYPASS_FUNCTION = "cde-recommend-prod"
 BYPASS_ALIAS: str | None = None
 BYPASS_REGION = "us-east-2"
+# Column batches (opt-in via discovery_bypass_batch_size) are invoked at most this many at a time.
+BYPASS_MAX_CONCURRENCY = 8
 # Async Step Functions API Gateway endpoint
 ASYNC_API_URL = "https://6ueocdz4mc.execute-api.us-east-2.amazonaws.com/staging"
 ASYNC_POLL_INTERVAL_SECONDS = 3.0
@@ -63,6 +66,9 @@ def build_settings(
     harmonization_url: str | None = None,
     data_model_store_url: str | None = None,
     environment: Environment | None = None,
+    pv_cache_directory: Path | str | None = None,
+    discovery_bypass_batch_size: int | None = None,
+    http2: bool | None = None,
 ) -> Settings:
     """Return a validated Settings snapshot for the provided configuration.
 
@@ -78,6 +84,9 @@ def build_settings(
     bypass_enabled = _normalized_bool(discovery_use_gateway_bypass, default=False)
     async_api_enabled = _normalized_bool(discovery_use_async_api, default=False)
     directory = _validated_log_directory(log_directory)
+    pv_cache = _validated_directory(pv_cache_directory, "PV cache")
+    bypass_batch_size = _validated_batch_size(discovery_bypass_batch_size)
+    http2_enabled = _validated_http2(http2)
 
     env_urls = _ENVIRONMENT_URLS.get(environment) if environment else None
     resolved_discovery_url = discovery_url or (env_urls or {}).get("discovery", DISCOVERY_BASE_URL)
@@ -98,6 +107,9 @@ def build_settings(
         log_directory=directory,
         data_model_store_endpoints=data_model_store_endpoints,
         discovery_use_async_api=async_api_enabled,
+        pv_cache_directory=pv_cache,
+        discovery_bypass_batch_size=bypass_batch_size,
+        http2=http2_enabled,
     )
 
 
@@ -119,6 +131,21 @@ def _validated_timeout(timeout: float | None) -> float:
     return float(timeout)
 
 
+def _validated_batch_size(value: int | None) -> int | None:
+    if value is None:
+        return None
+    if value < 1:
+        raise ClientConfigurationError("discovery_bypass_batch_size must be a positive integer")
+    return int(value)
+
+
+def _validated_http2(value: bool | None) -> bool:
+    enabled = _normalized_bool(value, default=False)
+    if enabled and importlib.util.find_spec("h2") is None:
+        raise ClientConfigurationError("http2 requires the 'h2' package; install netrias_client[http2]")
+    return enabled
+
+
 def validated_confidence_threshold(value: float | None, default: float = 0.8) -> float:
     """Validate and return a confidence threshold value.
 
@@ -139,11 +166,15 @@ def _normalized_bool(value: bool | None, default: bool = False) -> bool:
 
 
 def _validated_log_directory(value: Path | str | None) -> Path | None:
+    return _validated_directory(value, "log")
+
+
+def _validated_directory(value: Path | str | None, purpose: str) -> Path | None:
     if value is None:
         return None
     directory = Path(value)
     try:
         directory.mkdir(parents=True, exist_ok=True)
     except OSError as exc:
-        raise ClientConfigurationError(f"unable to create log directory {directory}: {exc}") from exc
+        raise ClientConfigurationError(f"unable to create {purpose} directory {directory}: {exc}") from exc
     return directory
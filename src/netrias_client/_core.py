@@ -11,15 +11,16 @@ import random
 import time
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Final, TypeAlias, cast
+from typing import Final, TypeAlias, cast, override
 
 import httpx
 
 from ._errors import HarmonizationJobError, NetriasAPIUnavailable
-from ._http import build_harmonize_payload, fetch_job_status, submit_harmonize_job
+from ._http import build_harmonize_payload, fetch_job_status, request_client, shared_client_scope, submit_harmonize_job
 from ._io import stream_download_to_file
 from ._logging import LOGGER_NAMESPACE
 from ._models import HarmonizationResult, Settings
+from ._serialization import loads
 from ._tabular import TabularFormat, csv_bytes_to_dataset, tabular_format_for_path, write_tabular
 from ._validators import next_available_path, validate_manifest_path, validate_output_path, validate_source_path
 
@@ -64,68 +65,70 @@ async def harmonize_async(
         source_format=source_format,
     )
 
-    started = time.perf_counter()
-    status_label = "error"
-    job_id: str | None = None
-    logger.info("harmonize start: file=%s", csv_path)
+    # 'why': submit, every status poll, and both downloads share one keep-alive client
+    async with shared_client_scope(settings.timeout, http2=settings.http2):
+        started = time.perf_counter()
+        status_label = "error"
+        job_id: str | None = None
+        logger.info("harmonize start: file=%s", csv_path)
 
-    try:
-        payload = build_harmonize_payload(
-            csv_path,
-            manifest_input,
-            data_commons_key,
-            external_version_number=external_version_number,
-            sheet_name=sheet_name,
-            use_cache=use_cache,
-        )
-        job_payload = await _submit_job_response(
-            base_url=settings.harmonization_url,
-            api_key=settings.api_key,
-            timeout=settings.timeout,
-            payload=payload,
-            csv_path=csv_path,
-            logger=logger,
-        )
-        job_id = _require_job_id(job_payload, csv_path, logger)
-        logger.info("harmonize job queued: file=%s job_id=%s", csv_path, job_id)
-        final_payload = await _resolve_final_payload(
-            base_url=settings.harmonization_url,
-            api_key=settings.api_key,
-            job_id=job_id,
-            timeout=settings.timeout,
-            csv_path=csv_path,
-            logger=logger,
-        )
-        final_url = _require_final_url(final_payload, csv_path, logger)
-        manifest_url = _extract_manifest_url(final_payload)
-    except HarmonizationJobError as exc:
-        status_label = "failed"
-        return HarmonizationResult(file_path=dest, status="failed", description=str(exc), job_id=job_id)
-    else:
-        manifest_path: Path | None = None
-        if manifest_url:
-            manifest_path = await _download_manifest(manifest_url, dest, settings.timeout, logger)
-        result = await _download_final(
-            final_url,
-            dest,
-            settings.timeout,
-            csv_path,
-            source_format,
-            sheet_name,
-            logger,
-            manifest_path,
-            job_id,
-        )
-        status_label = result.status
-        return result
-    finally:
-        elapsed = time.perf_counter() - started
-        logger.info(
-            "harmonize finished: file=%s status=%s duration=%.2fs",
-            csv_path,
-            status_label,
-            elapsed,
-        )
+        try:
+            payload = build_harmonize_payload(
+                csv_path,
+                manifest_input,
+                data_commons_key,
+                external_version_number=external_version_number,
+                sheet_name=sheet_name,
+                use_cache=use_cache,
+            )
+            job_payload = await _submit_job_response(
+                base_url=settings.harmonization_url,
+                api_key=settings.api_key,
+                timeout=settings.timeout,
+                payload=payload,
+                csv_path=csv_path,
+                logger=logger,
+            )
+            job_id = _require_job_id(job_payload, csv_path, logger)
+            logger.info("harmonize job queued: file=%s job_id=%s", csv_path, job_id)
+            final_payload = await _resolve_final_payload(
+                base_url=settings.harmonization_url,
+                api_key=settings.api_key,
+                job_id=job_id,
+                timeout=settings.timeout,
+                csv_path=csv_path,
+                logger=logger,
+            )
+            final_url = _require_final_url(final_payload, csv_path, logger)
+            manifest_url = _extract_manifest_url(final_payload)
+        except HarmonizationJobError as exc:
+            status_label = "failed"
+            return HarmonizationResult(file_path=dest, status="failed", description=str(exc), job_id=job_id)
+        else:
+            manifest_path: Path | None = None
+            if manifest_url:
+                manifest_path = await _download_manifest(manifest_url, dest, settings.timeout, logger)
+            result = await _download_final(
+                final_url,
+                dest,
+                settings.timeout,
+                csv_path,
+                source_format,
+                sheet_name,
+                logger,
+                manifest_path,
+                job_id,
+            )
+            status_label = result.status
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "harmonize finished: file=%s status=%s duration=%.2fs",
+                csv_path,
+                status_label,
+                elapsed,
+            )
 
 
 def _resolve_manifest(
@@ -153,23 +156,25 @@ def _manifest_from_path(
 def _manifest_from_mapping(
     manifest: Mapping[str, object], manifest_output_path: Path | None
 ) -> Path | Mapping[str, object]:
-    normalized = _normalize_manifest_mapping(manifest)
+    """'why': when writing to disk the indented text is the only artifact needed, so
+    serialize once instead of round-tripping through a normalized copy first."""
     if manifest_output_path is None:
-        return normalized
+        return _normalize_manifest_mapping(manifest)
+    serialized = _serialize_manifest_mapping(manifest, indent=2)
     manifest_output_path.parent.mkdir(parents=True, exist_ok=True)
-    _ = manifest_output_path.write_text(
-        json.dumps(normalized, indent=2),
-        encoding="utf-8",
-    )
+    _ = manifest_output_path.write_text(serialized, encoding="utf-8")
     return manifest_output_path
 
 
 def _normalize_manifest_mapping(manifest: Mapping[str, object]) -> dict[str, object]:
+    return cast(dict[str, object], json.loads(_serialize_manifest_mapping(manifest)))
+
+
+def _serialize_manifest_mapping(manifest: Mapping[str, object], indent: int | None = None) -> str:
     try:
-        serialized = json.dumps(manifest)
+        return json.dumps(manifest, indent=indent)
     except TypeError as exc:  # pragma: no cover - guarded by tests
         raise ValueError("manifest mapping must be JSON-serializable") from exc
-    return cast(dict[str, object], json.loads(serialized))
 
 
 async def _submit_job_response(
@@ -231,7 +236,7 @@ def _ensure_submit_success(response: httpx.Response, csv_path: Path, logger: log
         "harmonize submit failed: file=%s status=%s body=%s",
         csv_path,
         response.status_code,
-        _formatted_body(payload_for_log),
+        _LoggedBody(payload_for_log),
     )
     raise HarmonizationJobError(message)
 
@@ -336,7 +341,7 @@ async def _job_status_response_or_none(
             response.status_code,
             elapsed,
             message,
-            _formatted_body(payload_for_log),
+            _LoggedBody(payload_for_log),
         )
         return None
     return response
@@ -391,7 +396,7 @@ def _validated_status_payload(response: httpx.Response, csv_path: Path, logger:
             "harmonize job status failed: file=%s status=%s body=%s",
             csv_path,
             response.status_code,
-            _formatted_body(payload_for_log),
+            _LoggedBody(payload_for_log),
         )
         raise HarmonizationJobError(message)
 
@@ -442,7 +447,7 @@ async def _download_manifest(
     """Download manifest parquet to same directory as CSV output."""
     manifest_dest = _manifest_destination(harmonized_dest)
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+        async with request_client(timeout) as client:
             async with client.stream("GET", manifest_url) as response:
                 if 200 <= response.status_code < 300:
                     _ = await stream_download_to_file(response, manifest_dest)
@@ -467,7 +472,7 @@ async def _download_final(
     job_id: str | None = None,
 ) -> HarmonizationResult:
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+        async with request_client(timeout) as client:
             async with client.stream("GET", final_url) as response:
                 if 200 <= response.status_code < 300:
                     await _write_successful_download(response, dest, source_format, csv_path, sheet_name)
@@ -486,7 +491,7 @@ async def _download_final(
                     "harmonize download failed: file=%s status=%s body=%s",
                     csv_path,
                     response.status_code,
-                    _formatted_body(_payload_for_logging(body_bytes)),
+                    _LoggedBody(body_bytes.decode("utf-8", errors="replace")),
                 )
                 return HarmonizationResult(
                     file_path=dest,
@@ -539,7 +544,7 @@ def _error_description(status: int, body_text: str, default: str) -> tuple[str,
 
 def _json_mapping(response: httpx.Response) -> Mapping[str, JSONValue]:
     try:
-        data = cast(object, response.json())
+        data = loads(response.content)
     except (json.JSONDecodeError, ValueError):
         return {}
     if isinstance(data, Mapping):
@@ -638,6 +643,24 @@ def _failure_hint(status: int) -> str | None:
     return None
 
 
+class _LoggedBody:
+    """Render a response body for a log record only if the record is emitted.
+
+    'why': pretty-printing re-parses and re-serializes the body; logging defers
+    `str()` on arguments until a handler formats the record, so disabled levels
+    skip that work entirely
+    """
+
+    __slots__: tuple[str, ...] = ("_payload",)
+
+    def __init__(self, payload: JSONValue | str) -> None:
+        self._payload: JSONValue | str = payload
+
+    @override
+    def __str__(self) -> str:
+        return _formatted_body(self._payload)
+
+
 def _formatted_body(payload: JSONValue | str) -> str:
     if isinstance(payload, str):
         return _formatted_string_body(payload)
@@ -4,23 +4,75 @@
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import TypeGuard
+from functools import partial
+from typing import Generic, Protocol, TypeGuard, TypeVar, cast
 
 import httpx
 
 from ._errors import DataModelStoreError, NetriasAPIUnavailable
-from ._http import fetch_cdes, fetch_data_models, fetch_pvs
+from ._http import context_without_shared_client, fetch_cdes, fetch_data_models, fetch_pvs, shared_client_scope
 from ._logging import LOGGER_NAMESPACE
 from ._models import CDE, DataModel, DataModelStoreEndpoints, DataModelVersion, Settings
+from ._pv_cache import load_cached_pv_set, store_cached_pv_set
+from ._serialization import loads
 
 _logger = logging.getLogger(LOGGER_NAMESPACE)
 
 MAX_PAGINATION_PAGES = 100
 PV_PAGE_SIZE = 1000
+PV_FETCH_CONCURRENCY = 8
+
+
+LOOKUP_CACHE_MAXSIZE = 512
+
+_V = TypeVar("_V")
+
+
+class _PvPageFetcher(Protocol):
+    def __call__(self, *, offset: int, if_none_match: str | None = None) -> Awaitable[_PvPageResponse]: ...
+
+
+class _LookupCache(Generic[_V]):
+    """Bounded, thread-safe LRU of completed Data Model Store lookups.
+
+    'why': results rather than in-flight futures are stored, so entries stay valid
+    across the separate event loops that run_sync creates for sync callers
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize: int = maxsize
+        self._entries: OrderedDict[tuple[object, ...], _V] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: tuple[object, ...]) -> _V | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[object, ...], value: _V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                _ = self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CDE_CACHE: _LookupCache[tuple[CDE, ...]] = _LookupCache(LOOKUP_CACHE_MAXSIZE)
+_PV_SET_CACHE: _LookupCache[frozenset[str]] = _LookupCache(LOOKUP_CACHE_MAXSIZE)
+_PV_SET_INFLIGHT: dict[tuple[object, ...], asyncio.Future[frozenset[str]]] = {}
 
 
 def _require_endpoints(settings: Settings) -> DataModelStoreEndpoints:
@@ -77,11 +129,31 @@ async def list_cdes_async(
 ) -> tuple[CDE, ...]:
     """Fetch CDEs for a data model version from the Data Model Store.
 
-    'why': expose available fields for a schema version
+    'why': expose available fields for a schema version; results are memoized per
+    process because a published version's CDEs never change
     """
 
     endpoints = _require_endpoints(settings)
+    key = (endpoints.base_url, settings.api_key, model_key, version, include_description, query, limit, offset)
+    cached = _CDE_CACHE.get(key)
+    if cached is not None:
+        return cached
 
+    cdes = await _fetch_cdes(settings, endpoints, model_key, version, include_description, query, limit, offset)
+    _CDE_CACHE.put(key, cdes)
+    return cdes
+
+
+async def _fetch_cdes(
+    settings: Settings,
+    endpoints: DataModelStoreEndpoints,
+    model_key: str,
+    version: str,
+    include_description: bool,
+    query: str | None,
+    limit: int | None,
+    offset: int,
+) -> tuple[CDE, ...]:
     try:
         response = await fetch_cdes(
             base_url=endpoints.base_url,
@@ -112,45 +184,178 @@ async def get_pv_set_async(
 ) -> frozenset[str]:
     """Return all permissible values as a set for membership testing.
 
-    'why': validation use case requires O(1) lookup; pagination is hidden
+    'why': validation use case requires O(1) lookup; pagination is hidden, and sets
+    are memoized per process because a published version's PVs never change
     """
 
     endpoints = _require_endpoints(settings)
-    all_values: list[str] = []
-    offset = 0
-    page_count = 0
+    key = (endpoints.base_url, settings.api_key, model_key, version, cde_key, include_inactive)
+    cached = _PV_SET_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-    while page_count < MAX_PAGINATION_PAGES:
-        page_values = await _fetch_pv_page_values(
-            endpoints=endpoints,
-            api_key=settings.api_key,
-            timeout=settings.timeout,
-            model_key=model_key,
-            version=version,
-            cde_key=cde_key,
-            include_inactive=include_inactive,
-            offset=offset,
-        )
-        all_values.extend(page_values)
+    fetch = partial(_fetch_pv_set, settings, endpoints, model_key, version, cde_key, include_inactive)
+    return await _coalesced_pv_set(key, fetch)
+
+
+async def _coalesced_pv_set(key: tuple[object, ...], fetch: Callable[[], Awaitable[frozenset[str]]]) -> frozenset[str]:
+    """Join an in-flight fetch of the same PV set on this event loop, or start one.
+
+    'why': concurrent validations against one CDE would otherwise each page through
+    the same set; in-flight tasks are keyed by loop because run_sync callers each
+    run their own event loop, and a task cannot be awaited from another loop
+    """
+
+    inflight_key = (asyncio.get_running_loop(), *key)
+    task = _PV_SET_INFLIGHT.get(inflight_key)
+    if task is None:
+        # 'why': the task serves every waiter, so it must not borrow the first waiter's
+        # scoped client, which that waiter's cancellation would close mid-fetch
+        detached = context_without_shared_client()
+        task = detached.run(asyncio.ensure_future, _fetch_and_cache_pv_set(key, fetch))
+        _PV_SET_INFLIGHT[inflight_key] = task
+
+        def forget(_done: asyncio.Future[frozenset[str]]) -> None:
+            _ = _PV_SET_INFLIGHT.pop(inflight_key, None)
+
+        task.add_done_callback(forget)
+    # 'why': one waiter being cancelled must not cancel the fetch the others share
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache_pv_set(key: tuple[object, ...], fetch: Callable[[], Awaitable[frozenset[str]]]) -> frozenset[str]:
+    pv_set = await fetch()
+    _PV_SET_CACHE.put(key, pv_set)
+    return pv_set
+
+
+async def validate_values_async(
+    settings: Settings,
+    checks: Sequence[tuple[str, str, str, str]],
+) -> tuple[bool, ...]:
+    """Check each `(value, model_key, version, cde_key)` against its CDE's permissible values.
+
+    'why': grouping checks by CDE fetches each PV set once, however many values are checked;
+    the fan-out is gated like page fetches so a wide batch cannot open a connection per CDE
+    """
+
+    cde_refs = list(dict.fromkeys((model_key, version, cde_key) for _, model_key, version, cde_key in checks))
+    gate = asyncio.Semaphore(PV_FETCH_CONCURRENCY)
 
-        if len(page_values) < PV_PAGE_SIZE:
-            break
-        offset += PV_PAGE_SIZE
-        page_count += 1
+    async def fetch(cde_ref: tuple[str, str, str]) -> frozenset[str]:
+        async with gate:
+            return await get_pv_set_async(settings, *cde_ref)
 
-    if page_count >= MAX_PAGINATION_PAGES:
+    pv_sets = await asyncio.gather(*(fetch(cde_ref) for cde_ref in cde_refs))
+    by_ref = dict(zip(cde_refs, pv_sets))
+    return tuple(value in by_ref[(model_key, version, cde_key)] for value, model_key, version, cde_key in checks)
+
+
+def clear_lookup_cache() -> None:
+    """Forget every memoized CDE list and PV set."""
+
+    _CDE_CACHE.clear()
+    _PV_SET_CACHE.clear()
+
+
+async def _fetch_pv_set(
+    settings: Settings,
+    endpoints: DataModelStoreEndpoints,
+    model_key: str,
+    version: str,
+    cde_key: str,
+    include_inactive: bool,
+) -> frozenset[str]:
+    fetch_page: _PvPageFetcher = partial(
+        _fetch_pv_page,
+        endpoints=endpoints,
+        api_key=settings.api_key,
+        timeout=settings.timeout,
+        model_key=model_key,
+        version=version,
+        cde_key=cde_key,
+        include_inactive=include_inactive,
+    )
+
+    disk_key = (endpoints.base_url, model_key, version, cde_key, include_inactive)
+    cached = load_cached_pv_set(settings.pv_cache_directory, disk_key)
+
+    # 'why': every page of one PV set goes to the same host; reuse one connection
+    async with shared_client_scope(settings.timeout, http2=settings.http2):
+        first = await fetch_page(offset=0, if_none_match=cached.etag if cached else None)
+        if first.not_modified and cached is not None:
+            return cached.values
+        pv_set = await _collect_pv_values(fetch_page, first, f"{model_key}/{version}/{cde_key}")
+
+    if _served_by_first_page(first):
+        store_cached_pv_set(settings.pv_cache_directory, disk_key, first.etag, pv_set)
+    return pv_set
+
+
+def _served_by_first_page(first: _PvPageResponse) -> bool:
+    """'why': the stored ETag validates only the first page, so a 304 can vouch for the
+    whole set only when no later page exists to change independently"""
+    return first.total <= PV_PAGE_SIZE and len(first.values) < PV_PAGE_SIZE
+
+
+async def _collect_pv_values(fetch_page: _PvPageFetcher, first: _PvPageResponse, label: str) -> frozenset[str]:
+    """Fetch every page after `first` and return the union of their values.
+
+    'why': pages stream into one set; only their sizes are kept to detect a full last page
+    """
+
+    values = set(first.values)
+    offsets = _remaining_pv_offsets(first.total)
+    page_sizes = [len(first.values), *await _fetch_pv_pages_concurrently(fetch_page, offsets, values)]
+    await _fetch_trailing_pv_pages(fetch_page, page_sizes, values)
+
+    if len(page_sizes) >= MAX_PAGINATION_PAGES and page_sizes[-1] >= PV_PAGE_SIZE:
         _logger.warning(
-            "get_pv_set reached pagination limit (%d pages); results may be truncated for %s/%s/%s",
+            "get_pv_set reached pagination limit (%d pages); results may be truncated for %s",
             MAX_PAGINATION_PAGES,
-            model_key,
-            version,
-            cde_key,
+            label,
         )
 
-    return frozenset(all_values)
+    return frozenset(values)
 
 
-async def _fetch_pv_page_values(
+def _remaining_pv_offsets(total: int) -> range:
+    """Return the offsets of every page after the first, as implied by the reported total."""
+
+    return range(PV_PAGE_SIZE, min(total, MAX_PAGINATION_PAGES * PV_PAGE_SIZE), PV_PAGE_SIZE)
+
+
+async def _fetch_pv_pages_concurrently(fetch_page: _PvPageFetcher, offsets: range, values: set[str]) -> list[int]:
+    """Fetch the given pages in parallel into `values`, returning page sizes in offset order.
+
+    'why': once the first page reports the total, the remaining pages are independent;
+    issuing them together costs about one round trip instead of one per page
+    """
+
+    gate = asyncio.Semaphore(PV_FETCH_CONCURRENCY)
+
+    async def fetch(offset: int) -> int:
+        async with gate:
+            page = (await fetch_page(offset=offset)).values
+        values.update(page)
+        return len(page)
+
+    return list(await asyncio.gather(*(fetch(offset) for offset in offsets)))
+
+
+async def _fetch_trailing_pv_pages(fetch_page: _PvPageFetcher, page_sizes: list[int], values: set[str]) -> None:
+    """Keep paging sequentially while the last page is full.
+
+    'why': a missing or stale total must not truncate the set
+    """
+
+    while page_sizes[-1] >= PV_PAGE_SIZE and len(page_sizes) < MAX_PAGINATION_PAGES:
+        page = (await fetch_page(offset=len(page_sizes) * PV_PAGE_SIZE)).values
+        values.update(page)
+        page_sizes.append(len(page))
+
+
+async def _fetch_pv_page(
     endpoints: DataModelStoreEndpoints,
     api_key: str,
     timeout: float,
@@ -159,8 +364,9 @@ async def _fetch_pv_page_values(
     cde_key: str,
     include_inactive: bool,
     offset: int,
-) -> list[str]:
-    """Fetch a single page of PV values, returning only the 'value' string from each item."""
+    if_none_match: str | None = None,
+) -> _PvPageResponse:
+    """Fetch and parse a single page of PVs; a 304 yields an empty page flagged `not_modified`."""
 
     response = await _request_pv_page(
         endpoints=endpoints,
@@ -171,9 +377,12 @@ async def _fetch_pv_page_values(
         cde_key=cde_key,
         include_inactive=include_inactive,
         offset=offset,
+        if_none_match=if_none_match,
     )
+    if response.status_code == 304:
+        return _PvPageResponse(values=(), total=0, not_modified=True)
     body = _interpret_response(response)
-    return list(_PvPageResponse.from_json(body).values)
+    return _PvPageResponse.from_json(body, etag=cast(str | None, response.headers.get("ETag")))
 
 
 async def _request_pv_page(
@@ -185,6 +394,7 @@ async def _request_pv_page(
     cde_key: str,
     include_inactive: bool,
     offset: int,
+    if_none_match: str | None,
 ) -> httpx.Response:
     try:
         return await fetch_pvs(
@@ -197,6 +407,7 @@ async def _request_pv_page(
             include_inactive=include_inactive,
             limit=PV_PAGE_SIZE,
             offset=offset,
+            if_none_match=if_none_match,
         )
     except httpx.TimeoutException as exc:
         raise NetriasAPIUnavailable("data model store request timed out") from exc
@@ -261,7 +472,8 @@ def _response_json_mapping(response: httpx.Response) -> dict[str, object] | None
 
 
 def _decode_response_json(response: httpx.Response) -> object:
-    return response.json()  # pyright: ignore[reportAny]
+    """'why': PV pages carry up to PV_PAGE_SIZE items; decode the raw bytes via the orjson-backed shim."""
+    return loads(response.content)
 
 
 def _optional_string(raw: object) -> str | None:
@@ -288,12 +500,10 @@ def _json_object(raw: object) -> dict[str, object] | None:
 
 
 def _json_array(raw: object) -> list[object] | None:
+    """'why': the list is freshly decoded and only read, so a PV page's items are not copied."""
     if not _is_object_list(raw):
         return None
-    parsed: list[object] = []
-    for item in raw:
-        parsed.append(item)
-    return parsed
+    return raw
 
 
 def _is_object_dict(raw: object) -> TypeGuard[dict[object, object]]:
@@ -304,7 +514,7 @@ def _is_object_list(raw: object) -> TypeGuard[list[object]]:
     return isinstance(raw, list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ErrorResponse:
     message: str | None
 
@@ -317,7 +527,7 @@ class _ErrorResponse:
         return cls(message=None)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DataModelsResponse:
     items: tuple[_DataModelItem, ...]
 
@@ -333,7 +543,7 @@ class _DataModelsResponse:
         return tuple(item.to_domain() for item in self.items)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DataModelItem:
     data_commons_id: int
     key: str
@@ -368,7 +578,7 @@ class _DataModelItem:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DataModelVersionItem:
     external_version_number: str
 
@@ -402,7 +612,7 @@ def _external_version_number_from_json(body: Mapping[str, object]) -> str | None
     return candidate or None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CdesResponse:
     items: tuple[_CdeItem, ...]
 
@@ -418,7 +628,7 @@ class _CdesResponse:
         return tuple(item.to_domain() for item in self.items)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CdeItem:
     cde_key: str
     cde_id: int
@@ -446,23 +656,27 @@ class _CdeItem:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PvPageResponse:
     values: tuple[str, ...]
+    total: int
+    etag: str | None = None
+    not_modified: bool = False
 
     @classmethod
-    def from_json(cls, body: Mapping[str, object]) -> _PvPageResponse:
+    def from_json(cls, body: Mapping[str, object], etag: str | None = None) -> _PvPageResponse:
+        total = _int_or_zero(body.get("total"))
         items = _json_array(body.get("items"))
         if items is None:
-            return cls(values=())
+            return cls(values=(), total=total, etag=etag)
 
-        values = [value for raw in items if (value := _pv_value_from_json(raw)) is not None]
-        return cls(values=tuple(values))
+        values = tuple(value for raw in items if (value := _pv_value_from_json(raw)) is not None)
+        return cls(values=values, total=total, etag=etag)
 
 
 def _pv_value_from_json(raw: object) -> str | None:
-    item = _json_object(raw)
-    if item is None:
+    """'why': runs once per PV; read the value in place instead of copying each item."""
+    if not _is_object_dict(raw):
         return None
-    value = item.get("value")
+    value = raw.get("value")
     return value if isinstance(value, str) else None
@@ -8,6 +8,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sys
 import time
 from collections.abc import Mapping
 from pathlib import Path
@@ -16,7 +17,14 @@ from typing import NoReturn, cast
 import httpx
 
 from ._adapter import build_column_mapping_payload
-from ._config import ASYNC_API_URL, BYPASS_ALIAS, BYPASS_FUNCTION, BYPASS_REGION, validated_confidence_threshold
+from ._config import (
+    ASYNC_API_URL,
+    BYPASS_ALIAS,
+    BYPASS_FUNCTION,
+    BYPASS_MAX_CONCURRENCY,
+    BYPASS_REGION,
+    validated_confidence_threshold,
+)
 from ._errors import (
     AsyncDiscoveryError,
     GatewayBypassError,
@@ -39,6 +47,7 @@ from ._models import (
     MappingSuggestion,
     Settings,
 )
+from ._serialization import loads
 from ._sfn_discovery import discover_via_step_functions
 from ._tabular import TabularDataset, read_tabular
 from ._validators import validate_external_version_number, validate_source_path, validate_target_schema, validate_top_k
@@ -184,6 +193,8 @@ async def _discover_with_backend(
             timeout_seconds=settings.timeout,
             logger=logger,
             top_k=top_k,
+            batch_size=settings.discovery_bypass_batch_size,
+            max_concurrency=BYPASS_MAX_CONCURRENCY,
         )
         return _result_from_payload(payload, schema, outbound_names)
 
@@ -298,7 +309,7 @@ def _mapping_or_none(data: object) -> Mapping[str, object] | None:
 
 def _safe_json(response: httpx.Response) -> object:
     try:
-        return cast(object, response.json())
+        return loads(response.content)
     except json.JSONDecodeError:
         return None
 
@@ -313,13 +324,13 @@ def _resolve_body_optional(container: Mapping[str, object]) -> dict[str, object]
         return None
     parsed = _decode_body(body, strict=False)
     if isinstance(parsed, dict):
-        return _coerce_mapping(cast(Mapping[object, object], parsed), strict=False)
+        return _coerce_mapping(cast(dict[object, object], parsed), strict=False)
     return None
 
 
 def _expect_mapping(data: object) -> dict[str, object]:
     if isinstance(data, dict):
-        mapping = _coerce_mapping(cast(Mapping[object, object], data), strict=True)
+        mapping = _coerce_mapping(cast(dict[object, object], data), strict=True)
         if mapping is not None:
             return mapping
     raise MappingDiscoveryError("mapping discovery response body must be a JSON object")
@@ -330,29 +341,29 @@ def _extract_body_object(container: Mapping[str, object]) -> dict[str, object] |
         return None
     parsed = _decode_body(container["body"], strict=True)
     if isinstance(parsed, dict):
-        mapping = _coerce_mapping(cast(Mapping[object, object], parsed), strict=True)
+        mapping = _coerce_mapping(cast(dict[object, object], parsed), strict=True)
         if mapping is not None:
             return mapping
     raise MappingDiscoveryError("mapping discovery response body must be a JSON object")
 
 
-def _coerce_mapping(obj: Mapping[object, object], strict: bool) -> dict[str, object] | None:
-    result: dict[str, object] = {}
-    for key, value in obj.items():
-        if not isinstance(key, str):
-            if strict:
-                raise MappingDiscoveryError("mapping discovery response body must be a JSON object")
-            return None
-        result[key] = value
-    return result
+def _coerce_mapping(obj: dict[object, object], strict: bool) -> dict[str, object] | None:
+    """'why': the dict is freshly parsed and never mutated, so it is returned as-is once
+    its keys are confirmed to be strings rather than rebuilt key by key."""
+    if all(isinstance(key, str) for key in obj):
+        return cast(dict[str, object], obj)
+    if strict:
+        raise MappingDiscoveryError("mapping discovery response body must be a JSON object")
+    return None
 
 
 def _samples_from_dataset(dataset: TabularDataset, sample_limit: int) -> list[ColumnSamples]:
     sample_rows = dataset.rows[:sample_limit]
     samples = _collect_column_samples(sample_rows, len(dataset.columns))
+    # 'why': `dataset.headers` rebuilds the header list on every access
     return [
-        ColumnSamples(column_name=dataset.headers[i], values=samples[i])
-        for i in range(len(dataset.columns))
+        ColumnSamples(column_name=column.header, values=values)
+        for column, values in zip(dataset.columns, samples)
     ]
 
 
@@ -385,21 +396,27 @@ def _require_nonempty_header(headers: list[str], dataset: Path) -> None:
 
 
 def _collect_column_samples(rows: list[list[str]], column_count: int) -> list[list[str]]:
-    samples: list[list[str]] = [[] for _ in range(column_count)]
-    for row in rows:
-        padded = row + [""] * max(0, column_count - len(row))
-        for i in range(column_count):
-            value = padded[i].strip()
-            if value:
-                samples[i].append(value)
-    return samples
+    """'why': transpose once with zip so each column is stripped and filtered in a
+    single comprehension instead of re-indexing every padded row per column."""
+    columns: list[tuple[str, ...]] = list(zip(*(_fit_row(row, column_count) for row in rows))) or [()] * column_count
+    return [[value for cell in column if (value := cell.strip())] for column in columns]
+
+
+def _fit_row(row: list[str], column_count: int) -> list[str]:
+    # 'why': dataset rows are already normalized to the header width, so the common
+    # case passes through without a copy
+    if len(row) == column_count:
+        return row
+    if len(row) > column_count:
+        return row[:column_count]
+    return row + [""] * (column_count - len(row))
 
 
 def _decode_body(body: object, strict: bool) -> object:
     if not isinstance(body, str):
         return body
     try:
-        return cast(object, json.loads(body))
+        return loads(body)
     except json.JSONDecodeError as exc:
         if strict:
             raise MappingDiscoveryError("mapping discovery body was not valid JSON") from exc
@@ -471,7 +488,10 @@ def _suggestion_from_entry(
     _require_column_name_parity(column_name, expected_column_name, index)
     matches = _require_entry_matches(entry_map, index)
     options = _options_from_list(matches)
-    return MappingSuggestion(source_column=column_name, options=options, raw=dict(entry_map), column_id=index)
+    # 'why': parity makes the parsed name equal to the outbound header; the interned header
+    # is shared across suggestions and repeat discoveries instead of one parsed copy each
+    source_column = sys.intern(expected_column_name)
+    return MappingSuggestion(source_column=source_column, options=options, raw=entry_map, column_id=index)
 
 
 def _require_column_name_parity(
@@ -516,25 +536,21 @@ def _require_entry_matches(entry_map: Mapping[str, object], index: int) -> list[
 
 
 def _options_from_list(options_list: list[object]) -> tuple[MappingRecommendationOption, ...]:
-    options: list[MappingRecommendationOption] = []
-    for item in options_list:
-        if not isinstance(item, Mapping):
-            continue
-        mapping = cast(Mapping[str, object], item)
-        target = _option_target(mapping)
-        confidence = _option_confidence(mapping)
-        target_cde_id = _option_target_cde_id(mapping)
-        harmonization = _require_option_harmonization(mapping)
-        options.append(
-            MappingRecommendationOption(
-                target=target,
-                confidence=confidence,
-                harmonization=harmonization,
-                target_cde_id=target_cde_id,
-                raw=mapping,
-            )
-        )
-    return tuple(options)
+    """'why': matches arrive from a JSON decode, so every object is a plain dict;
+    one comprehension over a dict check avoids the ABC isinstance and loop overhead."""
+    return tuple(
+        _option_from_mapping(cast(dict[str, object], item)) for item in options_list if isinstance(item, dict)
+    )
+
+
+def _option_from_mapping(mapping: dict[str, object]) -> MappingRecommendationOption:
+    return MappingRecommendationOption(
+        target=_option_target(mapping),
+        confidence=_option_confidence(mapping),
+        harmonization=_require_option_harmonization(mapping),
+        target_cde_id=_option_target_cde_id(mapping),
+        raw=mapping,
+    )
 
 
 def _require_option_harmonization(option: Mapping[str, object]) -> Harmonization:
@@ -564,6 +580,9 @@ def _option_target(option: Mapping[str, object]) -> str | None:
 def _option_confidence(option: Mapping[str, object]) -> float | None:
     """'why': upstream API returns the score under 'confidence'; no other key is emitted."""
     value = option.get("confidence")
+    # 'why': exact-type fast path for the shape the API actually emits
+    if type(value) is float:
+        return value
     # 'why': bool is subclass of int in Python; must guard before int/float check
     if isinstance(value, bool):
         return None
@@ -574,6 +593,9 @@ def _option_confidence(option: Mapping[str, object]) -> float | None:
 
 def _option_target_cde_id(option: Mapping[str, object]) -> int | None:
     value = option.get("target_cde_id")
+    # 'why': exact int (never bool) is the common case and needs no conversion
+    if type(value) is int:
+        return value
     # 'why': API may return float (e.g., 900.0) or int; normalize to int
     if isinstance(value, bool):
         return None
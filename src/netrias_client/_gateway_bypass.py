@@ -10,11 +10,17 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Mapping
-from typing import Callable, IO, Protocol, cast
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, Final, IO, Protocol, cast
 
 from ._errors import GatewayBypassError
 from ._logging import LOGGER_NAMESPACE
 from ._models import ColumnSamples
+from ._serialization import dumps_bytes, loads
+
+LAMBDA_MAX_POOL_CONNECTIONS: Final[int] = 10
 
 
 class _LambdaClient(Protocol):
@@ -37,6 +43,17 @@ class _SessionProtocol(Protocol):
         ...
 
 
+@dataclass(frozen=True, slots=True)
+class _InvokeTarget:
+    """Fields shared by every Lambda invocation of one discovery request."""
+
+    function_name: str
+    alias: str | None
+    target_schema: str
+    external_version_number: str
+    top_k: int | None
+
+
 def invoke_cde_recommendation_alias(
     target_schema: str,
     external_version_number: str,
@@ -48,9 +65,15 @@ def invoke_cde_recommendation_alias(
     profile_name: str | None = None,
     logger: logging.Logger | None = None,
     top_k: int | None = None,
+    batch_size: int | None = None,
+    max_concurrency: int = 8,
 ) -> Mapping[str, object]:
     """Call the CDE recommendation Lambda alias directly and return its parsed payload.
 
+    When `batch_size` is set and `columns` exceeds it, the columns are split into
+    batches invoked concurrently (at most `max_concurrency` in flight) and their
+    `results` arrays are concatenated in column order.
+
     NOTE: This bypass is temporary. Prefer the public API once API Gateway limits are addressed.
     """
 
@@ -59,78 +82,127 @@ def invoke_cde_recommendation_alias(
         profile_name=profile_name,
         timeout_seconds=timeout_seconds,
     )
+    target = _InvokeTarget(function_name, alias, target_schema, external_version_number, top_k)
+    active_logger = logger or logging.getLogger(LOGGER_NAMESPACE)
+    batches = _column_batches(columns, batch_size)
+    if len(batches) == 1:
+        return _invoke_columns(client, target, batches[0], active_logger)
+
+    # 'why': boto3 invoke blocks for the Lambda's full runtime; overlapping the batches
+    # makes wall time track the slowest batch instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as pool:
+        responses = list(pool.map(partial(_invoke_columns, client, target, logger=active_logger), batches))
+    return _merged_batch_responses(responses)
+
+
+def _column_batches(columns: list[ColumnSamples], batch_size: int | None) -> list[list[ColumnSamples]]:
+    if batch_size is None or len(columns) <= batch_size:
+        return [columns]
+    return [columns[start : start + batch_size] for start in range(0, len(columns), batch_size)]
+
+
+def _merged_batch_responses(responses: list[Mapping[str, object]]) -> Mapping[str, object]:
+    """'why': each batch answers positionally for its own columns, so concatenating the
+    `results` arrays in batch order preserves the index == column_id contract."""
+    merged = dict(responses[0])
+    merged["results"] = [result for response in responses for result in _batch_results(response)]
+    return merged
+
+
+def _batch_results(response: Mapping[str, object]) -> list[object]:
+    # 'why': dropping a malformed batch would surface later as a confusing column-count mismatch
+    results = response.get("results")
+    if not isinstance(results, list):
+        raise GatewayBypassError("missing 'results' array")
+    return cast(list[object], results)
+
+
+def _invoke_columns(
+    client: _LambdaClient,
+    target: _InvokeTarget,
+    columns: list[ColumnSamples],
+    logger: logging.Logger,
+) -> Mapping[str, object]:
     body_dict: dict[str, object] = {
-        "target_schema": target_schema,
-        "external_version_number": external_version_number,
+        "target_schema": target.target_schema,
+        "external_version_number": target.external_version_number,
         "columns": columns,
     }
-    if top_k is not None:
-        body_dict["top_k"] = top_k
-    body = json.dumps(body_dict)
-    event = {"body": body, "isBase64Encoded": False}
+    if target.top_k is not None:
+        body_dict["top_k"] = target.top_k
+    event_bytes = _proxy_event_bytes(dumps_bytes(body_dict))
 
-    active_logger = logger or logging.getLogger(LOGGER_NAMESPACE)
-
-    active_logger.info(
+    logger.info(
         "gateway bypass invoke start: function=%s alias=%s schema=%s columns=%s",
-        function_name,
-        alias,
-        target_schema,
+        target.function_name,
+        target.alias,
+        target.target_schema,
         len(columns),
     )
 
-    payload_bytes = json.dumps(event).encode("utf-8")
-
-    try:
-        if alias is not None:
-            response = client.invoke(
-                FunctionName=function_name,
-                Qualifier=alias,
-                Payload=payload_bytes,
-            )
-        else:
-            response = client.invoke(
-                FunctionName=function_name,
-                Payload=payload_bytes,
-            )
-    except Exception as exc:  # pragma: no cover - boto3 specific
-        active_logger.error(
-            "gateway bypass invoke failed: function=%s alias=%s err=%s",
-            function_name,
-            alias,
-            exc,
-        )
-        raise GatewayBypassError(f"lambda invoke failed: {exc}") from exc
-
+    response = _invoke_lambda(client, target, event_bytes, logger)
     status_code = response.get("StatusCode")
     payload_stream = cast(IO[bytes] | None, response.get("Payload"))
     raw_payload = _read_lambda_payload(payload_stream)
     payload = _json_payload(raw_payload)
 
-    active_logger.info(
+    logger.info(
         "gateway bypass invoke complete: function=%s alias=%s status=%s",
-        function_name,
-        alias,
+        target.function_name,
+        target.alias,
         status_code,
     )
 
     return _extract_body_mapping(payload)
 
 
+def _proxy_event_bytes(body: bytes) -> bytes:
+    """'why': the Lambda proxy contract requires a string body; only that string needs
+    escaping, so the fixed envelope is spliced around it instead of re-serializing a dict."""
+    return b'{"body":' + dumps_bytes(body.decode("utf-8")) + b',"isBase64Encoded":false}'
+
+
+def _invoke_lambda(
+    client: _LambdaClient,
+    target: _InvokeTarget,
+    payload_bytes: bytes,
+    logger: logging.Logger,
+) -> Mapping[str, object]:
+    try:
+        if target.alias is not None:
+            return client.invoke(
+                FunctionName=target.function_name,
+                Qualifier=target.alias,
+                Payload=payload_bytes,
+            )
+        return client.invoke(
+            FunctionName=target.function_name,
+            Payload=payload_bytes,
+        )
+    except Exception as exc:  # pragma: no cover - boto3 specific
+        logger.error(
+            "gateway bypass invoke failed: function=%s alias=%s err=%s",
+            target.function_name,
+            target.alias,
+            exc,
+        )
+        raise GatewayBypassError(f"lambda invoke failed: {exc}") from exc
+
+
+@lru_cache(maxsize=8)
 def _build_lambda_client(
     region_name: str,
     profile_name: str | None,
     timeout_seconds: float | None,
 ) -> _LambdaClient:
+    """Build (once per region/profile/timeout) a boto3 Lambda client.
+
+    'why': client construction loads service models and resolves credentials, costing
+    hundreds of milliseconds; boto3 clients are thread-safe, so repeat invocations
+    reuse the client and its warm connection pool
+    """
     boto3, Config = _load_boto_dependencies()
-    config = (
-        Config(
-            read_timeout=timeout_seconds,
-            connect_timeout=min(timeout_seconds, 10.0),
-        )
-        if timeout_seconds is not None
-        else None
-    )
+    config = cast(object, Config(**_lambda_config_options(timeout_seconds)))
 
     if profile_name:
         session_factory = cast(
@@ -148,6 +220,16 @@ def _build_lambda_client(
     return _lambda_client_from_factory(factory, region_name=region_name, config=config)
 
 
+def _lambda_config_options(timeout_seconds: float | None) -> dict[str, object]:
+    """'why': the client is cached and reused, so keep its pooled sockets alive between
+    invocations instead of letting idle connections drop and re-handshake."""
+    options: dict[str, object] = {"tcp_keepalive": True, "max_pool_connections": LAMBDA_MAX_POOL_CONNECTIONS}
+    if timeout_seconds is not None:
+        options["read_timeout"] = timeout_seconds
+        options["connect_timeout"] = min(timeout_seconds, 10.0)
+    return options
+
+
 def _load_boto_dependencies() -> tuple[object, type]:
     try:
         import boto3  # pyright: ignore[reportMissingTypeStubs]
@@ -181,7 +263,8 @@ def _json_payload(raw_payload: bytes) -> Mapping[str, object]:
     if not raw_payload:
         return {}
     try:
-        return cast(Mapping[str, object], json.loads(raw_payload.decode("utf-8")))
+        # 'why': both parsers accept UTF-8 bytes directly; decoding first copies the payload
+        return cast(Mapping[str, object], loads(raw_payload))
     except json.JSONDecodeError as exc:  # pragma: no cover - unexpected lambda output
         raise GatewayBypassError(f"lambda returned non-JSON payload: {exc}") from exc
 
@@ -201,7 +284,7 @@ def _parse_body(body: object) -> Mapping[str, object]:
     """Parse the body field from a Lambda response."""
     if isinstance(body, str):
         try:
-            return cast(Mapping[str, object], json.loads(body))
+            return cast(Mapping[str, object], loads(body))
         except json.JSONDecodeError as exc:  # pragma: no cover - unexpected lambda output
             raise GatewayBypassError(f"lambda body was not valid JSON: {exc}") from exc
     if isinstance(body, Mapping):
@@ -4,9 +4,11 @@
 """
 from __future__ import annotations
 
-import gzip
-import json
-from collections.abc import Mapping
+import zlib
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import Context, ContextVar, copy_context
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 from urllib.parse import quote
@@ -15,11 +17,73 @@ import httpx
 
 from ._adapter import MANIFEST_COLUMN_MAPPINGS_KEY, normalize_manifest_mapping
 from ._config import API_KEY_HEADER
-from ._models import ColumnSamples
+from ._models import ColumnMappingRecord, ColumnSamples
+from ._serialization import dumps_bytes
 from ._tabular import read_tabular
 
 SCHEMA_VERSION: Final[str] = "1.0"
 MAX_COMPRESSED_BYTES: Final[int] = 10 * 1024 * 1024
+FAST_COMPRESS_LEVEL: Final[int] = 1
+ROW_ENCODE_BATCH_SIZE: Final[int] = 1000
+_GZIP_WBITS: Final[int] = 16 + zlib.MAX_WBITS
+
+
+# 'why': status-retry backoff can exceed httpx's 5 s default keep-alive expiry, which
+# would drop the pooled connection mid-operation
+SHARED_CLIENT_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_keepalive_connections=8,
+    max_connections=16,
+    keepalive_expiry=30.0,
+)
+_SHARED_CLIENT: ContextVar[httpx.AsyncClient | None] = ContextVar("netrias_shared_http_client", default=None)
+
+
+@asynccontextmanager
+async def shared_client_scope(timeout: float, http2: bool = False) -> AsyncGenerator[None]:
+    """Route every request issued inside the block through one keep-alive client.
+
+    'why': multi-request operations (job polling, PV pagination) otherwise pay a fresh
+    TCP+TLS handshake per call; scoping the client to the operation keeps connection
+    reuse without a process-global client bound to whichever event loop created it.
+    Nested scopes join the outermost client. `http2` (opt-in, requires the `h2` package)
+    multiplexes the scope's concurrent requests over one connection.
+    """
+
+    if _SHARED_CLIENT.get() is not None:
+        yield
+        return
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout), limits=SHARED_CLIENT_LIMITS, http2=http2
+    ) as client:
+        token = _SHARED_CLIENT.set(client)
+        try:
+            yield
+        finally:
+            _SHARED_CLIENT.reset(token)
+
+
+def context_without_shared_client() -> Context:
+    """Return a copy of the current context with no operation-scoped client.
+
+    'why': a task that can outlive the scope it was started from must open its own
+    client instead of inheriting one that the scope's owner will close
+    """
+
+    context = copy_context()
+    _ = context.run(_SHARED_CLIENT.set, None)
+    return context
+
+
+@asynccontextmanager
+async def request_client(timeout: float) -> AsyncGenerator[httpx.AsyncClient]:
+    """Yield the operation's shared client, or a single-use client outside any scope."""
+
+    shared = _SHARED_CLIENT.get()
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+        yield client
 
 
 def build_harmonize_payload(
@@ -36,30 +100,72 @@ def build_harmonize_payload(
     validated_external_version_number = _validate_external_version_number(external_version_number)
     dataset = read_tabular(source_path, sheet_name=sheet_name)
 
-    envelope: dict[str, object] = {
+    envelope_head: dict[str, object] = {
         "schemaVersion": SCHEMA_VERSION,
         "data_commons_key": data_commons_key,
         "external_version_number": validated_external_version_number,
         "use_cache": use_cache,
-        "document": {
-            "name": source_path.name,
-            "sheetName": dataset.sheet_name,
-            "header": dataset.headers,
-            "rows": dataset.rows,
-        },
     }
-
+    document_head: dict[str, object] = {
+        "name": source_path.name,
+        "sheetName": dataset.sheet_name,
+        "header": dataset.headers,
+    }
     column_mappings = normalize_manifest_mapping(manifest, column_count=len(dataset.columns))
-    if column_mappings:
-        envelope[MANIFEST_COLUMN_MAPPINGS_KEY] = column_mappings
 
-    raw = json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    compressed = gzip.compress(raw)
+    compressed = _compress_payload(
+        lambda: _envelope_chunks(envelope_head, document_head, dataset.rows, column_mappings)
+    )
     if len(compressed) > MAX_COMPRESSED_BYTES:
         raise ValueError("compressed harmonization payload exceeds 10 MiB")
     return compressed
 
 
+def _envelope_chunks(
+    envelope_head: dict[str, object],
+    document_head: dict[str, object],
+    rows: list[list[str]],
+    column_mappings: list[ColumnMappingRecord | None],
+) -> Iterator[bytes]:
+    """Yield the compact JSON envelope piecewise, byte-identical to encoding it whole.
+
+    'why': the serialized rows are the largest buffer in the upload path; emitting them
+    in batches straight into the compressor means the full JSON text is never held
+    """
+    yield dumps_bytes(envelope_head)[:-1]
+    yield b',"document":' + dumps_bytes(document_head)[:-1] + b',"rows":['
+    yield from _row_chunks(rows)
+    yield b"]}"
+    if column_mappings:
+        yield b"," + dumps_bytes(MANIFEST_COLUMN_MAPPINGS_KEY) + b":" + dumps_bytes(column_mappings)
+    yield b"}"
+
+
+def _row_chunks(rows: list[list[str]]) -> Iterator[bytes]:
+    for start in range(0, len(rows), ROW_ENCODE_BATCH_SIZE):
+        separator = b"," if start else b""
+        # 'why': encode a batch as one JSON array and drop its brackets to splice it in
+        yield separator + dumps_bytes(rows[start : start + ROW_ENCODE_BATCH_SIZE])[1:-1]
+
+
+def _compress_payload(chunks: Callable[[], Iterable[bytes]]) -> bytes:
+    """'why': the only size constraint is the 10 MiB cap, so compress at the fast level
+    first and pay for maximum compression (level 9, gzip.compress's default) only when
+    that would decide acceptance.
+    The gzip header carries mtime=0 so identical payloads stay byte-identical."""
+    compressed = _gzip_chunks(chunks(), FAST_COMPRESS_LEVEL)
+    if len(compressed) <= MAX_COMPRESSED_BYTES:
+        return compressed
+    return _gzip_chunks(chunks(), 9)
+
+
+def _gzip_chunks(chunks: Iterable[bytes], level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    parts = [compressor.compress(chunk) for chunk in chunks]
+    parts.append(compressor.flush())
+    return b"".join(parts)
+
+
 def _validate_external_version_number(external_version_number: object) -> str:
     if not isinstance(external_version_number, str):
         raise ValueError("external_version_number must be a non-empty string")
@@ -88,9 +194,10 @@ async def submit_harmonize_job(
     if idempotency_key:
         headers["Idempotency-Key"] = idempotency_key
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.post(url, content=payload_gz, headers=headers)
 
+
 async def fetch_job_status(
     base_url: str,
     api_key: str,
@@ -101,7 +208,7 @@ async def fetch_job_status(
 
     url = _build_job_status_url(base_url, job_id)
     headers = {API_KEY_HEADER: api_key}
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.get(url, headers=headers)
 
 async def request_mapping_discovery(
@@ -127,7 +234,7 @@ async def request_mapping_discovery(
     }
     if top_k is not None:
         body["top_k"] = top_k
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.post(url, headers=headers, json=body)
 
 
@@ -143,11 +250,11 @@ async def fetch_data_models(
 ) -> httpx.Response:
     """Fetch data models from the Data Model Store."""
 
-    url = f"{base_url.rstrip('/')}/data-models"
+    url = f"{_normalized_base(base_url)}/data-models"
     headers = {API_KEY_HEADER: api_key}
     params = _build_data_models_params(query, include_versions, include_counts, limit, offset)
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.get(url, headers=headers, params=params)
 
 
@@ -183,7 +290,7 @@ async def fetch_cdes(
 ) -> httpx.Response:
     """Fetch CDEs for a data model version from the Data Model Store."""
 
-    url = f"{base_url.rstrip('/')}/data-models/{quote(model_key, safe='')}/versions/{quote(version, safe='')}/cdes"
+    url = f"{_model_version_url(base_url, model_key, version)}/cdes"
     headers = {API_KEY_HEADER: api_key}
     params: dict[str, str | int] = {"offset": offset}
     if include_description:
@@ -193,7 +300,7 @@ async def fetch_cdes(
     if limit is not None:
         params["limit"] = limit
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.get(url, headers=headers, params=params)
 
 
@@ -208,16 +315,15 @@ async def fetch_pvs(
     query: str | None = None,
     limit: int | None = None,
     offset: int = 0,
+    if_none_match: str | None = None,
 ) -> httpx.Response:
-    """Fetch permissible values for a CDE from the Data Model Store."""
+    """Fetch permissible values for a CDE from the Data Model Store.
 
-    path = (
-        f"/data-models/{quote(model_key, safe='')}"
-        f"/versions/{quote(version, safe='')}"
-        f"/cdes/{quote(cde_key, safe='')}/pvs"
-    )
-    url = f"{base_url.rstrip('/')}{path}"
-    headers = {API_KEY_HEADER: api_key}
+    Sends `If-None-Match` when `if_none_match` is given, so the server may answer 304.
+    """
+
+    url = _build_pvs_url(base_url, model_key, version, cde_key)
+    headers = _conditional_headers(api_key, if_none_match)
     params: dict[str, str | int] = {"offset": offset}
     if include_inactive:
         params["include_inactive"] = "true"
@@ -226,17 +332,44 @@ async def fetch_pvs(
     if limit is not None:
         params["limit"] = limit
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout)) as client:
+    async with request_client(timeout) as client:
         return await client.get(url, headers=headers, params=params)
 
+
+def _conditional_headers(api_key: str, if_none_match: str | None) -> dict[str, str]:
+    headers = {API_KEY_HEADER: api_key}
+    if if_none_match:
+        headers["If-None-Match"] = if_none_match
+    return headers
+
+
+@lru_cache(maxsize=16)
+def _normalized_base(base_url: str) -> str:
+    """'why': URL builders run on every poll and page; the handful of configured base
+    URLs are normalized once per process instead of per request."""
+    return base_url.rstrip("/")
+
+
 def _build_job_submit_url(base_url: str) -> str:
-    base = base_url.rstrip("/")
-    return f"{base}/v1/jobs/harmonize"
+    return f"{_normalized_base(base_url)}/v1/jobs/harmonize"
 
+
+@lru_cache(maxsize=64)
 def _build_job_status_url(base_url: str, job_id: str) -> str:
-    base = base_url.rstrip("/")
-    return f"{base}/v1/jobs/{quote(job_id, safe='')}"
+    """'why': status polling requests the same job URL until completion."""
+    return f"{_normalized_base(base_url)}/v1/jobs/{quote(job_id, safe='')}"
+
 
 def _build_discovery_url(base_url: str) -> str:
-    base = base_url.rstrip("/")
-    return f"{base}/recommend"
+    return f"{_normalized_base(base_url)}/recommend"
+
+
+@lru_cache(maxsize=64)
+def _model_version_url(base_url: str, model_key: str, version: str) -> str:
+    return f"{_normalized_base(base_url)}/data-models/{quote(model_key, safe='')}/versions/{quote(version, safe='')}"
+
+
+@lru_cache(maxsize=256)
+def _build_pvs_url(base_url: str, model_key: str, version: str, cde_key: str) -> str:
+    """'why': PV pagination re-requests the same CDE path once per page."""
+    return f"{_model_version_url(base_url, model_key, version)}/cdes/{quote(cde_key, safe='')}/pvs"
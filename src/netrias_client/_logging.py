@@ -9,6 +9,16 @@ from ._models import LogLevel
 
 
 _FORMAT: Final[str] = "%(asctime)s %(levelname)s netrias_client: %(message)s"
+_DATE_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S"
+# 'why': formatters are stateless, so every handler shares one instead of rebuilding per configure()
+_FORMATTER: Final[logging.Formatter] = logging.Formatter(fmt=_FORMAT, datefmt=_DATE_FORMAT)
+_LEVELS: Final[dict[LogLevel, int]] = {
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.DEBUG: logging.DEBUG,
+}
 LOGGER_NAMESPACE: Final[str] = "netrias_client"
 """Parent logger namespace for external configuration.
 
@@ -33,7 +43,6 @@ def configure_logger(
     logger = logging.getLogger(name)
     _close_and_clear_handlers(logger)
 
-    formatter = logging.Formatter(fmt=_FORMAT)
     parent = logging.getLogger(LOGGER_NAMESPACE)
 
     # Enable propagation to respect external logger configuration
@@ -44,7 +53,7 @@ def configure_logger(
         # No external handlers; add our own stream handler
         logger.propagate = False
         stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
+        stream_handler.setFormatter(_FORMATTER)
         logger.addHandler(stream_handler)
 
     # File handler is instance-specific, always add if requested
@@ -52,17 +61,10 @@ def configure_logger(
         log_directory.mkdir(parents=True, exist_ok=True)
         file_path = log_directory / f"{name.replace('.', '_')}.log"
         file_handler = logging.FileHandler(file_path, encoding="utf-8")
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
-    mapping = {
-        LogLevel.CRITICAL: logging.CRITICAL,
-        LogLevel.ERROR: logging.ERROR,
-        LogLevel.WARNING: logging.WARNING,
-        LogLevel.INFO: logging.INFO,
-        LogLevel.DEBUG: logging.DEBUG,
-    }
-    logger.setLevel(mapping[level])
+    logger.setLevel(_LEVELS[level])
     return logger
 
 
@@ -101,7 +101,7 @@ class LogLevel(str, Enum):
     DEBUG = "DEBUG"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Capture runtime settings for API calls."""
 
@@ -114,6 +114,9 @@ class Settings:
     log_directory: Path | None
     data_model_store_endpoints: DataModelStoreEndpoints | None = None
     discovery_use_async_api: bool = False
+    pv_cache_directory: Path | None = None
+    discovery_bypass_batch_size: int | None = None
+    http2: bool = False
 
     @override
     def __repr__(self) -> str:
@@ -125,11 +128,13 @@ class Settings:
             f"harmonization_url={self.harmonization_url!r}, timeout={self.timeout!r}, "
             f"log_level={self.log_level!r}, discovery_use_gateway_bypass={self.discovery_use_gateway_bypass!r}, "
             f"log_directory={self.log_directory!r}, data_model_store_endpoints={self.data_model_store_endpoints!r}, "
-            f"discovery_use_async_api={self.discovery_use_async_api!r})"
+            f"discovery_use_async_api={self.discovery_use_async_api!r}, "
+            f"pv_cache_directory={self.pv_cache_directory!r}, "
+            f"discovery_bypass_batch_size={self.discovery_bypass_batch_size!r}, http2={self.http2!r})"
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationContext:
     """Bundle settings and logger for atomic snapshotting.
 
@@ -140,7 +145,7 @@ class OperationContext:
     logger: logging.Logger
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HarmonizationResult:
     """Communicate harmonization outcome in a consistent shape."""
 
@@ -152,7 +157,7 @@ class HarmonizationResult:
     job_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingRecommendationOption:
     """Capture a single recommended target for a source column."""
 
@@ -163,7 +168,7 @@ class MappingRecommendationOption:
     raw: Mapping[str, object] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingSuggestion:
     """Group recommendation options for a single source column."""
 
@@ -173,7 +178,7 @@ class MappingSuggestion:
     column_id: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingDiscoveryResult:
     """Communicate column mapping recommendations for a dataset."""
 
@@ -182,7 +187,7 @@ class MappingDiscoveryResult:
     raw: Mapping[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataModelStoreEndpoints:
     """Encapsulate Data Model Store endpoint URLs for swappability.
 
@@ -192,14 +197,14 @@ class DataModelStoreEndpoints:
     base_url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataModelVersion:
     """Represent a version of a data model."""
 
     external_version_number: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataModel:
     """Represent a data commons/model from the Data Model Store."""
 
@@ -211,7 +216,7 @@ class DataModel:
     versions: tuple[DataModelVersion, ...] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CDE:
     """Represent a Common Data Element within a data model version."""
 
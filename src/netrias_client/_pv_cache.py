@@ -0,0 +1,80 @@
+"""Persist permissible-value sets on disk between processes.
+
+'why': CLI-style callers start a fresh process per run; a stored set plus the
+server's ETag turns the next run's full pagination into one conditional request
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from ._logging import LOGGER_NAMESPACE
+from ._serialization import dumps_bytes, loads
+
+_logger = logging.getLogger(LOGGER_NAMESPACE)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPvSet:
+    """A PV set as last served, with the ETag that validates it."""
+
+    etag: str
+    values: frozenset[str]
+
+
+def load_cached_pv_set(directory: Path | None, key: tuple[object, ...]) -> CachedPvSet | None:
+    """Return the stored entry for `key`, or None when caching is off or the entry is unusable."""
+
+    if directory is None:
+        return None
+    try:
+        raw = loads(_entry_path(directory, key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    return _entry_from_json(raw)
+
+
+def store_cached_pv_set(directory: Path | None, key: tuple[object, ...], etag: str | None, values: frozenset[str]) -> None:
+    """Atomically write the entry for `key`; a set served without an ETag is not stored.
+
+    'why': the cache is an optimization, so write failures are logged rather than raised
+    """
+
+    if directory is None or etag is None:
+        return
+    try:
+        _write_atomically(_entry_path(directory, key), dumps_bytes({"etag": etag, "values": sorted(values)}))
+    except OSError as exc:
+        _logger.warning("unable to write PV cache entry in %s: %s", directory, exc)
+
+
+def _entry_path(directory: Path, key: tuple[object, ...]) -> Path:
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+    return directory / f"{digest}.json"
+
+
+def _entry_from_json(raw: object) -> CachedPvSet | None:
+    if not isinstance(raw, dict):
+        return None
+    body = cast(dict[str, object], raw)
+    etag, values = body.get("etag"), body.get("values")
+    if not isinstance(etag, str) or not isinstance(values, list):
+        return None
+    return CachedPvSet(etag=etag, values=frozenset(value for value in cast(list[object], values) if isinstance(value, str)))
+
+
+def _write_atomically(path: Path, payload: bytes) -> None:
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False, suffix=".partial") as tmp:
+            tmp_path = Path(tmp.name)
+            _ = tmp.write(payload)
+        _ = tmp_path.replace(path)
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,45 @@
+"""Encode and decode JSON wire payloads with an optional orjson fast path.
+
+'why': the harmonize envelope and gateway-bypass events are the largest JSON
+documents the client produces; orjson serializes straight to UTF-8 bytes when it
+is installed, and the stdlib fallback emits the same compact encoding otherwise
+"""
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from typing import Final, cast
+
+_Dumps = Callable[[object], bytes]
+_Loads = Callable[[bytes | str], object]
+
+
+def _load_orjson() -> tuple[_Dumps, _Loads] | None:
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:  # pragma: no cover - optional accelerator
+        return None
+    return cast(_Dumps, getattr(orjson, "dumps")), cast(_Loads, getattr(orjson, "loads"))
+
+
+_ORJSON: Final[tuple[_Dumps, _Loads] | None] = _load_orjson()
+
+
+def dumps_bytes(value: object) -> bytes:
+    """Serialize `value` as compact UTF-8 JSON bytes.
+
+    Raises TypeError for values that are not JSON-serializable under either backend.
+    """
+
+    if _ORJSON is not None:
+        return _ORJSON[0](value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: bytes | str) -> object:
+    """Parse JSON text or UTF-8 bytes; raises `json.JSONDecodeError` on malformed input."""
+
+    if _ORJSON is not None:
+        return _ORJSON[1](raw)
+    return cast(object, json.loads(raw))
@@ -18,6 +18,7 @@ import httpx
 from ._config import API_KEY_HEADER, ASYNC_POLL_INTERVAL_SECONDS, BYPASS_REGION
 from ._errors import AsyncDiscoveryError
 from ._models import ColumnSamples
+from ._serialization import loads
 
 TERMINAL_STATES: Final[frozenset[str]] = frozenset({"SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED"})
 
@@ -81,7 +82,7 @@ def _start_execution(
     with httpx.Client(timeout=30.0) as client:
         response = client.post(url, json=wrapper, headers=headers)
         _ = response.raise_for_status()
-        result = cast(dict[str, object], response.json())
+        result = cast(dict[str, object], loads(response.content))
 
     execution_arn = result.get("executionArn")
     if not isinstance(execution_arn, str) or not execution_arn:
@@ -162,7 +163,7 @@ def _parse_output(output_str: str) -> Mapping[str, object]:
 def _safe_json_loads(text: str, context: str) -> object:
     """Parse JSON or raise AsyncDiscoveryError with context."""
     try:
-        return cast(object, json.loads(text))
+        return loads(text)
     except json.JSONDecodeError as exc:
         raise AsyncDiscoveryError(f"Invalid JSON in {context}: {exc}") from exc
 
@@ -193,7 +193,7 @@ def _read_delimited_text(path: Path, source_format: TabularFormat) -> TabularDat
         reader = csv.reader(handle, delimiter=source_format.delimiter)
         default_headers: list[str] = []
         headers = next(reader, default_headers)
-        raw_rows = [list(row) for row in reader]
+        raw_rows = list(reader)
 
     return dataset_from_rows(headers=headers, rows=raw_rows, source_format=source_format)
 
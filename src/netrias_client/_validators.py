@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import os
+import stat
+from collections.abc import Callable
 from pathlib import Path
 
 from ._errors import FileValidationError, MappingValidationError, OutputLocationError
@@ -15,22 +17,27 @@ from ._tabular import SUPPORTED_TABULAR_SUFFIXES, TabularFormat
 HARD_MAX_CSV_BYTES = 250 * 1024 * 1024
 HARD_MAX_TABULAR_BYTES = HARD_MAX_CSV_BYTES
 
+_MAX_OUTPUT_VERSIONS = 999
+
+# 'why': module-bound so tests can fake filesystem answers here without patching `os` globally
+_stat = os.stat
+_access = os.access
+_scandir = os.scandir
+
 
 def validate_source_path(path: Path) -> Path:
     """Ensure the tabular source exists, has a supported extension, and respects size limits."""
 
-    _require_exists(path, "source tabular file not found")
-    _require_is_file(path, "source path is not a file")
+    size = _stat_regular_file(path, "source tabular file not found", "source path is not a file").st_size
     _require_tabular_suffix(path)
-    _require_not_too_large(path)
+    _require_not_too_large(size)
     return path
 
 
 def validate_manifest_path(path: Path) -> Path:
     """Ensure the manifest JSON exists and is a file."""
 
-    _require_exists(path, "manifest JSON not found")
-    _require_is_file(path, "manifest path is not a file")
+    _ = _stat_regular_file(path, "manifest JSON not found", "manifest path is not a file")
     _require_suffix(path, ".json", "manifest must be a .json file")
     return path
 
@@ -86,14 +93,18 @@ def validate_top_k(top_k: int | None) -> int | None:
     return top_k
 
 
-def _require_exists(path: Path, message: str) -> None:
-    if not path.exists():
-        raise FileValidationError(f"{message}: {path}")
-
+def _stat_regular_file(path: Path, missing_message: str, not_file_message: str) -> os.stat_result:
+    """'why': one stat answers existence, file type, and size instead of a syscall per check."""
 
-def _require_is_file(path: Path, message: str) -> None:
-    if not path.is_file():
-        raise FileValidationError(f"{message}: {path}")
+    try:
+        result = _stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileValidationError(f"{missing_message}: {path}") from None
+    except OSError as exc:
+        raise FileValidationError(f"unable to stat {path}: {exc}") from exc
+    if not stat.S_ISREG(result.st_mode):
+        raise FileValidationError(f"{not_file_message}: {path}")
+    return result
 
 
 def _require_suffix(path: Path, suffix: str, message: str) -> None:
@@ -108,11 +119,7 @@ def _require_tabular_suffix(path: Path) -> None:
     raise FileValidationError(f"unsupported file extension for source tabular file: {path.suffix}; expected {supported}")
 
 
-def _require_not_too_large(path: Path) -> None:
-    try:
-        size = os.path.getsize(path)
-    except OSError as exc:
-        raise FileValidationError(f"unable to stat source tabular file: {exc}") from exc
+def _require_not_too_large(size: int) -> None:
     if size > HARD_MAX_TABULAR_BYTES:
         raise FileValidationError(
             f"source tabular file exceeds hard-coded limit of {HARD_MAX_TABULAR_BYTES // (1024 * 1024)} MB (got {size} bytes)"
@@ -122,7 +129,7 @@ def _require_not_too_large(path: Path) -> None:
 def _resolve_output_candidate(path: Path | None, source_name: str, source_format: TabularFormat) -> Path:
     if path is None:
         return Path.cwd() / f"{source_name}.harmonized{source_format.suffix}"
-    if path.exists() and path.is_dir():
+    if path.is_dir():
         return path / f"{source_name}.harmonized{source_format.suffix}"
     return path
 
@@ -137,8 +144,9 @@ def _ensure_parent(candidate: Path) -> None:
 
 
 def _require_parent_writable(candidate: Path) -> None:
+    # 'why': _ensure_parent has already created the parent, so no separate existence stat
     parent = candidate.parent
-    if parent.exists() and not os.access(parent, os.W_OK):
+    if not _access(parent, os.W_OK):
         raise OutputLocationError(f"output directory not writable: {parent}")
 
 
@@ -152,15 +160,38 @@ def next_available_path(candidate: Path) -> Path:
 
     if not candidate.exists():
         return candidate
-    stem = candidate.stem
-    suffix = candidate.suffix
-    parent = candidate.parent
-    index = 1
-    while index < 1000:
-        versioned = parent / f"{stem}.v{index}{suffix}"
-        if not versioned.exists():
+    is_taken = _taken_probe(candidate)
+    for index in range(1, _MAX_OUTPUT_VERSIONS + 1):
+        versioned = candidate.with_name(f"{candidate.stem}.v{index}{candidate.suffix}")
+        if not is_taken(versioned):
             return versioned
-        index += 1
     raise OutputLocationError(
-        f"unable to determine unique output path after {index - 1} attempts for {candidate}"
+        f"unable to determine unique output path after {_MAX_OUTPUT_VERSIONS} attempts for {candidate}"
     )
+
+
+def _taken_probe(candidate: Path) -> Callable[[Path], bool]:
+    """'why': one directory read replaces an exists() stat per candidate version; a
+    directory that allows search but not listing falls back to probing each path"""
+    try:
+        with _scandir(candidate.parent) as entries:
+            names = [entry.name for entry in entries]
+    except OSError:
+        return Path.exists
+    if _is_case_insensitive(candidate):
+        folded = frozenset(name.casefold() for name in names)
+        return lambda path: path.name.casefold() in folded
+    listed = frozenset(names)
+    return lambda path: path.name in listed
+
+
+def _is_case_insensitive(existing: Path) -> bool:
+    # 'why': `existing` is on disk, so its case-swapped twin resolving to the same file
+    # means the filesystem folds case and `V1` would collide with `v1`
+    twin = existing.with_name(existing.name.swapcase())
+    if twin.name == existing.name:
+        return False
+    try:
+        return os.path.samefile(existing, twin)
+    except OSError:
+        return False
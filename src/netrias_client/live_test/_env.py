@@ -0,0 +1,31 @@
+"""Resolve credentials for live API smoke tests."""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+from ._constants import ENV_PATH
+
+
+def env_value(key: str, path: Path = ENV_PATH) -> str | None:
+    """'why': already-exported variables win, and the dotenv file is parsed once per
+    on-disk revision so repeated imports (notebooks, fixtures) skip the rescan."""
+    return os.environ.get(key) or _dotenv(path, _mtime_ns(path)).get(key)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=8)
+def _dotenv(path: Path, mtime_ns: int) -> dict[str, str]:
+    """'why': values are stripped once at parse time; blank entries count as unset."""
+    _ = mtime_ns
+    return {key: stripped for key, value in dotenv_values(path).items() if value and (stripped := value.strip())}
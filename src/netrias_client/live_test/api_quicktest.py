@@ -5,12 +5,15 @@ Run with: uv run python -m netrias_client.live_test.api_quicktest
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import os
 import sys
 import traceback
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Coroutine
 from dataclasses import dataclass
+from typing import Final, cast
 
-from dotenv import dotenv_values
 from netrias_client import ColumnKeyedManifestPayload, NetriasClient
 
 from ._constants import (
@@ -21,6 +24,11 @@ from ._constants import (
     EXTERNAL_VERSION_NUMBER,
     MODEL_KEY,
 )
+from ._env import env_value
+
+# 'why': per-step diagnostics are buffered on each result and only printed on request,
+# so concurrent steps never interleave output and CI logs carry just the summary
+_VERBOSE: Final[bool] = os.environ.get("QUICKTEST_VERBOSE") == "1"
 
 
 @dataclass(slots=True)
@@ -28,7 +36,8 @@ class SmokeResult:
     name: str
     passed: bool
     message: str
-    details: str | None = None
+    error: Exception | None = None
+    notes: tuple[str, ...] = ()
 
 
 @dataclass(slots=True)
@@ -37,17 +46,19 @@ class SmokeContext:
     manifest: ColumnKeyedManifestPayload | None = None
 
 
-def _run_step(name: str, step: Callable[[], None]) -> SmokeResult:
+async def _run_step(name: str, step: Callable[[list[str]], Awaitable[None]]) -> SmokeResult:
+    notes: list[str] = []
     try:
-        step()
+        await step(notes)
     except Exception as exc:
         return SmokeResult(
             name=name,
             passed=False,
             message=f"{type(exc).__name__}: {exc}",
-            details=traceback.format_exc(),
+            error=exc,
+            notes=tuple(notes),
         )
-    return SmokeResult(name=name, passed=True, message="OK")
+    return SmokeResult(name=name, passed=True, message="OK", notes=tuple(notes))
 
 
 def main() -> int:
@@ -56,33 +67,63 @@ def main() -> int:
         return 1
 
     _print_header()
-    results = [
-        _run_step("data_model_store_lists_gc_model", lambda: _assert_data_model_store_lists_gc_model(context.client)),
-        _run_step(
-            "data_model_store_lists_sex_cde_for_external_version",
-            lambda: _assert_data_model_store_lists_sex_cde_for_external_version(context.client),
-        ),
-        _run_step(
-            "data_model_store_returns_sex_permissible_values",
-            lambda: _assert_data_model_store_returns_sex_permissible_values(context.client),
-        ),
-        _run_step(
-            "discovery_returns_column_keyed_manifest",
-            lambda: _assert_discovery_returns_column_keyed_manifest(context),
-        ),
-        _run_step(
-            "harmonization_returns_expected_status_for_discovered_manifest",
-            lambda: _assert_harmonization_returns_expected_status_for_discovered_manifest(context),
-        ),
-    ]
+    results = _run_event_loop(_run_all(context))
     return _print_results(results)
 
 
+def _run_event_loop(main_coroutine: Coroutine[object, object, list[SmokeResult]]) -> list[SmokeResult]:
+    """'why': the concurrent smoke steps are event-loop bound, so uvloop is used when it
+    happens to be installed; it is optional and the stdlib loop is the fallback."""
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return asyncio.run(main_coroutine)
+    run = cast(Callable[[Coroutine[object, object, list[SmokeResult]]], list[SmokeResult]], getattr(uvloop, "run"))
+    return run(main_coroutine)
+
+
+async def _run_all(context: SmokeContext) -> list[SmokeResult]:
+    """'why': every step is network-bound and only harmonization depends on discovery, so
+    the catalog checks overlap with the discovery -> harmonization chain."""
+    catalog, workflow = await asyncio.gather(_run_catalog_steps(context.client), _run_workflow_steps(context))
+    return [*catalog, *workflow]
+
+
+async def _run_catalog_steps(client: NetriasClient) -> list[SmokeResult]:
+    return list(
+        await asyncio.gather(
+            _run_step(
+                "data_model_store_lists_gc_model",
+                lambda notes: _assert_data_model_store_lists_gc_model(client, notes),
+            ),
+            _run_step(
+                "data_model_store_lists_sex_cde_for_external_version",
+                lambda notes: _assert_data_model_store_lists_sex_cde_for_external_version(client, notes),
+            ),
+            _run_step(
+                "data_model_store_returns_sex_permissible_values",
+                lambda notes: _assert_data_model_store_returns_sex_permissible_values(client, notes),
+            ),
+        )
+    )
+
+
+async def _run_workflow_steps(context: SmokeContext) -> list[SmokeResult]:
+    discovery = await _run_step(
+        "discovery_returns_column_keyed_manifest",
+        lambda notes: _assert_discovery_returns_column_keyed_manifest(context, notes),
+    )
+    harmonization = await _run_step(
+        "harmonization_returns_expected_status_for_discovered_manifest",
+        lambda notes: _assert_harmonization_returns_expected_status_for_discovered_manifest(context, notes),
+    )
+    return [discovery, harmonization]
+
+
 def _build_context() -> SmokeContext | None:
-    env = dotenv_values(ENV_PATH)
-    api_key = env.get("NETRIAS_API_KEY")
+    api_key = env_value("NETRIAS_API_KEY")
     if not api_key:
-        print(f"ERROR: NETRIAS_API_KEY not found in {ENV_PATH}")
+        print(f"ERROR: NETRIAS_API_KEY not found in environment or {ENV_PATH}")
         return None
     if not CSV_PATH.exists():
         print(f"ERROR: Test CSV not found: {CSV_PATH}")
@@ -102,20 +143,20 @@ def _print_header() -> None:
     print()
 
 
-def _assert_data_model_store_lists_gc_model(client: NetriasClient) -> None:
+async def _assert_data_model_store_lists_gc_model(client: NetriasClient, notes: list[str]) -> None:
     # Given: a configured client and the known-good model key
     # When: the user searches Data Model Store for that model
-    models = client.list_data_models(query=MODEL_KEY, include_versions=True, limit=5)
+    models = await client.list_data_models_async(query=MODEL_KEY, include_versions=True, limit=5)
 
     # Then: the Data Model Store exposes that model
     assert any(model.key == MODEL_KEY for model in models), f"Expected {MODEL_KEY!r} in data models"
-    print(f"  data model store model: {MODEL_KEY} listed in {len(models)} results")
+    notes.append(f"data model store model: {MODEL_KEY} listed in {len(models)} results")
 
 
-def _assert_data_model_store_lists_sex_cde_for_external_version(client: NetriasClient) -> None:
+async def _assert_data_model_store_lists_sex_cde_for_external_version(client: NetriasClient, notes: list[str]) -> None:
     # Given: a configured client, model key, external version number, and CDE key
     # When: the user queries CDEs for that external model version
-    cdes = client.list_cdes(
+    cdes = await client.list_cdes_async(
         model_key=MODEL_KEY,
         version=DISCOVERY_EXTERNAL_VERSION_NUMBER,
         query=CDE_KEY,
@@ -125,13 +166,13 @@ def _assert_data_model_store_lists_sex_cde_for_external_version(client: NetriasC
 
     # Then: the expected CDE is available
     assert len(cdes) > 0, f"Expected at least one CDE matching {CDE_KEY!r}"
-    print(f"  data model store CDE: {CDE_KEY} listed in {len(cdes)} results")
+    notes.append(f"data model store CDE: {CDE_KEY} listed in {len(cdes)} results")
 
 
-def _assert_data_model_store_returns_sex_permissible_values(client: NetriasClient) -> None:
+async def _assert_data_model_store_returns_sex_permissible_values(client: NetriasClient, notes: list[str]) -> None:
     # Given: a configured client, model key, external version number, and CDE key
     # When: the user asks for permissible values for that CDE
-    pv_set = client.get_pv_set(
+    pv_set = await client.get_pv_set_async(
         model_key=MODEL_KEY,
         version=DISCOVERY_EXTERNAL_VERSION_NUMBER,
         cde_key=CDE_KEY,
@@ -140,15 +181,15 @@ def _assert_data_model_store_returns_sex_permissible_values(client: NetriasClien
     # Then: permissible values are returned as the public frozenset contract
     assert isinstance(pv_set, frozenset)
     assert len(pv_set) > 0, f"Expected permissible values for {CDE_KEY!r}"
-    print(f"  data model store PVs: {len(pv_set)} values for {CDE_KEY}")
+    notes.append(f"data model store PVs: {len(pv_set)} values for {CDE_KEY}")
 
 
-def _assert_discovery_returns_column_keyed_manifest(context: SmokeContext) -> None:
+async def _assert_discovery_returns_column_keyed_manifest(context: SmokeContext, notes: list[str]) -> None:
     # Given: discovery has not yet produced a manifest for the harmonization step
     assert context.manifest is None
 
     # When: the user asks for CDE recommendations with an external version number
-    context.manifest = context.client.discover_mapping_from_tabular(
+    context.manifest = await context.client.discover_mapping_from_tabular_async(
         source_path=CSV_PATH,
         target_schema=MODEL_KEY,
         external_version_number=DISCOVERY_EXTERNAL_VERSION_NUMBER,
@@ -159,41 +200,47 @@ def _assert_discovery_returns_column_keyed_manifest(context: SmokeContext) -> No
     # Then: discovery returns a column-keyed manifest usable by harmonization
     mappings = context.manifest["column_mappings"]
     assert len(mappings) > 0, "Expected discovery to return column mappings"
-    print(f"  discovery: {len(mappings)} column mappings")
+    notes.append(f"discovery: {len(mappings)} column mappings")
 
 
-def _assert_harmonization_returns_expected_status_for_discovered_manifest(context: SmokeContext) -> None:
+async def _assert_harmonization_returns_expected_status_for_discovered_manifest(
+    context: SmokeContext, notes: list[str]
+) -> None:
     # Given: discovery already produced the manifest that harmonization consumes
     if context.manifest is None:
         raise RuntimeError("Discovery must run before harmonization")
 
     # When: the user submits the same source file and discovered manifest for harmonization
-    result = context.client.harmonize(
+    result = await context.client.harmonize_async(
         source_path=CSV_PATH,
         manifest=context.manifest,
         data_commons_key=MODEL_KEY,
         external_version_number=EXTERNAL_VERSION_NUMBER,
     )
-    print(f"  harmonization: {result.status}")
+    notes.append(f"harmonization: {result.status}")
 
     # Then: the live service returns either success or the known staging data-source mismatch
     is_known_failure = result.status == "failed" and (
         "unknown cde id" in result.description.lower() or "invalid" in result.description.lower()
     )
     if is_known_failure:
-        print("  harmonization note: CDE ID mismatch, auth and submission path verified")
+        notes.append("harmonization note: CDE ID mismatch, auth and submission path verified")
         return
 
     assert result.status == "succeeded", f"Expected 'succeeded', got {result.status!r}"
 
 
 def _print_results(results: list[SmokeResult]) -> int:
-    print()
+    lines = [""]
     for result in results:
         status = "PASS" if result.passed else "FAIL"
-        print(f"[{status}] {result.name}: {result.message}")
-        if not result.passed and result.details:
-            print(result.details)
+        lines.append(f"[{status}] {result.name}: {result.message}")
+        if _VERBOSE:
+            lines.extend(f"  {note}" for note in result.notes)
+        # 'why': tracebacks are formatted only when they are actually printed
+        if result.error is not None:
+            lines.append("".join(traceback.format_exception(result.error)))
+    print("\n".join(lines))
 
     return 0 if all(result.passed for result in results) else 1
 
@@ -15,6 +15,7 @@ from pathlib import Path
 import pandas as pd
 
 from ._data_model_store import get_pv_set_async
+from ._http import shared_client_scope
 from ._models import ColumnKeyedManifestPayload, Settings, ColumnMappingRecord
 from ._tabular import TabularDataset
 
@@ -207,15 +208,17 @@ async def run_overlap_analysis(
     report: list[dict[str, object]] = []
     flat_rows: list[dict[str, object]] = []
 
-    for col_key, info in manifest["column_mappings"].items():
-        if info.get("harmonization") != "harmonizable":
-            continue
-
-        entry, column_flat_rows = await _process_column(
-            col_key, info, column_indexes, dataset,
-            settings, target_schema, external_version_number, logger,
-        )
-        report.append(entry)
-        flat_rows.extend(column_flat_rows)
+    # 'why': each column's PV fetch hits the same Data Model Store host
+    async with shared_client_scope(settings.timeout, http2=settings.http2):
+        for col_key, info in manifest["column_mappings"].items():
+            if info.get("harmonization") != "harmonizable":
+                continue
+
+            entry, column_flat_rows = await _process_column(
+                col_key, info, column_indexes, dataset,
+                settings, target_schema, external_version_number, logger,
+            )
+            report.append(entry)
+            flat_rows.extend(column_flat_rows)
 
     _write_reports(report, flat_rows, output_dir, logger)
@@ -13,6 +13,7 @@ import subprocess
 import sys
 import tempfile
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final, cast
@@ -24,6 +25,7 @@ _COMMANDS: Final[tuple[tuple[str, ...], ...]] = (
     ("basedpyright", "."),
     ("vulture",),
 )
+_CHECK_SERIAL_ENV: Final[str] = "NETRIAS_CHECK_SERIAL"
 _REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
 _PYPROJECT_PATH: Final[Path] = _REPO_ROOT / "pyproject.toml"
 _PACKAGE_INIT_PATH: Final[Path] = Path(__file__).resolve().parent / "__init__.py"
@@ -51,12 +53,16 @@ class ReleaseOptions:
 def check() -> None:
     """Run the combined test and lint pipeline invoked by `uv run check`.
 
-    'why': provide a single entry point that exits early on the first failure
+    'why': provide a single entry point that fails when any stage fails; stages run
+    concurrently unless NETRIAS_CHECK_SERIAL=1 restores the stop-at-first-failure order
     """
 
     _ensure_logging()
-    for command in _COMMANDS:
-        _run_command_or_raise(command)
+    if os.environ.get(_CHECK_SERIAL_ENV) == "1":
+        for command in _COMMANDS:
+            _run_command_or_raise(command)
+        return
+    _run_commands_concurrently_or_raise(_COMMANDS)
 
 
 def release(argv: Sequence[str] | None = None) -> None:
@@ -90,6 +96,9 @@ def _run_command(command: Sequence[str], *, env: Mapping[str, str] | None = None
     'why': centralize subprocess logging and leave error handling to callers
     """
 
+    # 'why': a bare string satisfies Sequence[str] but subprocess treats it as one argv[0]
+    if isinstance(command, str):
+        raise TypeError(f"command must be an argv sequence, not a string: {command!r}")
     shown = display_command or command
     _LOGGER.info("→ %s", " ".join(shown))
     completed = subprocess.run(command, check=False, env=dict(env) if env else None)
@@ -112,6 +121,31 @@ def _run_command_or_raise(
         raise SystemExit(exit_code)
 
 
+def _run_commands_concurrently_or_raise(commands: Sequence[Sequence[str]]) -> None:
+    """Run independent `commands` in parallel and abort with the first non-zero status.
+
+    'why': wall time becomes the slowest stage instead of the sum; output is buffered
+    per command and replayed in order so logs stay readable
+    """
+
+    processes = [subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) for command in commands]
+    # 'why': drain every pipe at once so a chatty stage never blocks on a full buffer
+    with ThreadPoolExecutor(max_workers=len(processes)) as pool:
+        outputs = list(pool.map(_captured_output, processes))
+    for command, output in zip(commands, outputs):
+        _LOGGER.info("→ %s", " ".join(command))
+        _ = sys.stdout.write(output)
+    _ = sys.stdout.flush()
+    exit_code = next((process.returncode for process in processes if process.returncode != 0), 0)
+    if exit_code != 0:
+        raise SystemExit(exit_code)
+
+
+def _captured_output(process: subprocess.Popen[bytes]) -> str:
+    output, _ = process.communicate()
+    return output.decode("utf-8", errors="replace")
+
+
 def _parse_release_args(argv: Sequence[str] | None) -> ReleaseOptions:
     """Parse CLI arguments into a `ReleaseOptions` instance.
 
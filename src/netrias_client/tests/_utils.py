@@ -4,16 +4,20 @@
 """
 from __future__ import annotations
 
-import json
-from collections.abc import AsyncIterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import override
+from functools import partial
+from typing import ClassVar, Final, NotRequired, TypedDict, cast, override
 
 import httpx
 from pytest import MonkeyPatch
 
+from netrias_client._models import ColumnSamples
+from netrias_client._serialization import dumps_bytes, loads
+
 EXTERNAL_VERSION_NUMBER = "11.0.4"
 NEXT_EXTERNAL_VERSION_NUMBER = "11.0.5"
+_JSON_HEADERS: Final[Mapping[str, str]] = {"content-type": "application/json"}
 
 
 @dataclass(slots=True)
@@ -40,13 +44,14 @@ def job_success(
     """
 
     recorded: list[httpx.Request] = []
+    routes = _job_routes(job_id, final_url, manifest_url, chunks, manifest_chunks)
 
     async def handler(request: httpx.Request) -> httpx.Response:
         recorded.append(request)
-        response = _resolve_job_response(request, job_id, final_url, manifest_url, chunks, manifest_chunks)
-        if response is None:
+        route = routes.get((request.method, str(request.url))) or routes.get((request.method, _job_route_suffix(request)))
+        if route is None:
             raise AssertionError(f"unexpected request during job_success: {request.method} {request.url}")
-        return response
+        return route(request)
 
     return MockTransportCapture(httpx.MockTransport(handler), recorded)
 
@@ -57,24 +62,24 @@ def json_failure(payload: dict[str, object], status_code: int) -> MockTransportC
     'why': drive domain failure scenarios with realistic API responses
     """
 
-    recorded: list[httpx.Request] = []
-
-    async def handler(request: httpx.Request) -> httpx.Response:
-        recorded.append(request)
-        body = json.dumps(payload).encode("utf-8")
-        return httpx.Response(status_code, headers={"content-type": "application/json"}, content=body, request=request)
-
-    return MockTransportCapture(httpx.MockTransport(handler), recorded)
+    return _static_json(payload, status_code)
 
 
 def json_success(payload: Mapping[str, object], status_code: int = 200) -> MockTransportCapture:
     """Return a mock transport yielding a JSON success payload."""
 
+    return _static_json(payload, status_code)
+
+
+def _static_json(payload: Mapping[str, object], status_code: int) -> MockTransportCapture:
+    """'why': serialize the payload once per scenario, not once per request (polls, pages)."""
+
     recorded: list[httpx.Request] = []
+    content = dumps_bytes(payload)
 
     async def handler(request: httpx.Request) -> httpx.Response:
         recorded.append(request)
-        return httpx.Response(status_code, json=payload, request=request)
+        return httpx.Response(status_code, headers=_JSON_HEADERS, content=content, request=request)
 
     return MockTransportCapture(httpx.MockTransport(handler), recorded)
 
@@ -94,42 +99,82 @@ def transport_error(exc: Exception) -> MockTransportCapture:
     return MockTransportCapture(httpx.MockTransport(handler), recorded)
 
 
-def install_mock_transport(monkeypatch: MonkeyPatch, capture: MockTransportCapture) -> None:
-    """Patch httpx clients within modules to use the provided transport.
+def json_object(raw: bytes | str) -> dict[str, object]:
+    """Decode a captured JSON document that the test expects to be an object."""
+
+    return cast(dict[str, object], loads(raw))
+
+
+class RecommendationRequest(TypedDict):
+    """Outbound discovery request body as the tests observe it."""
+
+    target_schema: str
+    external_version_number: str
+    columns: list[ColumnSamples]
+    top_k: NotRequired[int]
 
-    'why': ensure the client under test routes through controlled mock transports
+
+def recommendation_request(raw: bytes | str) -> RecommendationRequest:
+    """Decode a captured discovery request body with its fields already typed."""
+
+    return cast(RecommendationRequest, loads(raw))
+
+
+def proxy_event_body(payload: bytes) -> RecommendationRequest:
+    """Return the decoded `body` of a Lambda proxy event, parsing each layer once.
+
+    'why': the Lambda proxy contract nests the request JSON as a string inside the event
     """
 
-    original_async_client = httpx.AsyncClient
-    original_sync_client = httpx.Client
+    body = json_object(payload)["body"]
+    assert isinstance(body, str), "Lambda proxy event body must be a JSON string"
+    return recommendation_request(body)
+
+
+class _MockRoutedAsyncClient(httpx.AsyncClient):
+    """Async client that always routes through the installed mock transport."""
+
+    mock_transport: ClassVar[httpx.MockTransport | None] = None
 
-    class _PatchedAsyncClient(original_async_client):
-        def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
-            kwdict: dict[str, object] = dict(kwargs)
-            kwdict["transport"] = capture.transport
-            super().__init__(**kwdict)  # pyright: ignore[reportArgumentType]
+    def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
+        kwdict: dict[str, object] = dict(kwargs)
+        kwdict["transport"] = _MockRoutedAsyncClient.mock_transport
+        super().__init__(**kwdict)  # pyright: ignore[reportArgumentType]
 
-    class _PatchedSyncClient(original_sync_client):
-        """Sync client wrapper that delegates to async transport via sync_execute.
 
-        'why': _sfn_discovery uses sync httpx.Client; we need to mock it too
-        """
+class _MockRoutedSyncClient(httpx.Client):
+    """Sync client that always routes through the installed mock transport.
+
+    'why': _sfn_discovery uses sync httpx.Client; we need to mock it too
+    """
+
+    mock_transport: ClassVar[httpx.MockTransport | None] = None
+
+    def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
+        kwdict: dict[str, object] = dict(kwargs)
+        kwdict["transport"] = _MockRoutedSyncClient.mock_transport
+        super().__init__(**kwdict)  # pyright: ignore[reportArgumentType]
+
+
+def install_mock_transport(monkeypatch: MonkeyPatch, capture: MockTransportCapture) -> None:
+    """Patch httpx clients within modules to use the provided transport.
 
-        def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
-            kwdict: dict[str, object] = dict(kwargs)
-            kwdict["transport"] = capture.transport
-            super().__init__(**kwdict)  # pyright: ignore[reportArgumentType]
+    'why': ensure the client under test routes through controlled mock transports; the
+    routed client classes are defined once, so installing a mock only swaps the transport
+    """
 
-    monkeypatch.setattr("netrias_client._http.httpx.AsyncClient", _PatchedAsyncClient)
-    monkeypatch.setattr("netrias_client._core.httpx.AsyncClient", _PatchedAsyncClient)
-    monkeypatch.setattr("netrias_client._sfn_discovery.httpx.Client", _PatchedSyncClient)
+    monkeypatch.setattr(_MockRoutedAsyncClient, "mock_transport", capture.transport)
+    monkeypatch.setattr(_MockRoutedSyncClient, "mock_transport", capture.transport)
+    # 'why': _http, _core, and _sfn_discovery all resolve clients through the shared httpx module
+    monkeypatch.setattr(httpx, "AsyncClient", _MockRoutedAsyncClient)
+    monkeypatch.setattr(httpx, "Client", _MockRoutedSyncClient)
 
 
 class _ChunkStream(httpx.AsyncByteStream):
     """Provide an async byte stream backed by an in-memory sequence."""
 
     def __init__(self, payload: Sequence[bytes]) -> None:
-        self._payload: list[bytes] = list(payload)
+        self._payload: tuple[bytes, ...] = payload if isinstance(payload, tuple) else tuple(payload)
 
     async def aiter_bytes(self) -> AsyncIterator[bytes]:
         for chunk in self._payload:
@@ -141,96 +186,77 @@ class _ChunkStream(httpx.AsyncByteStream):
 
 
 
-def _job_submit_response(request: httpx.Request, job_id: str) -> httpx.Response | None:
-    if request.method != "POST":
-        return None
-    if not request.url.path.endswith("/v1/jobs/harmonize"):
-        return None
-    return httpx.Response(202, json={"job_id": job_id}, request=request)
+_JobRoute = Callable[[httpx.Request], httpx.Response]
 
 
-def _job_status_response(
-    request: httpx.Request,
+def _job_routes(
     job_id: str,
     final_url: str,
     manifest_url: str | None,
-) -> httpx.Response | None:
-    if request.method != "GET":
-        return None
-    if not request.url.path.endswith(f"/v1/jobs/{job_id}"):
-        return None
+    chunks: Sequence[bytes],
+    manifest_chunks: Sequence[bytes],
+) -> dict[tuple[str, str], _JobRoute]:
+    """Map (method, route) keys to responders once per transport.
+
+    'why': downloads match on the exact URL while API routes match on their path suffix,
+    since the configured base URL varies between tests
+    """
+
+    routes: dict[tuple[str, str], _JobRoute] = {
+        ("POST", "/v1/jobs/harmonize"): partial(_job_submit_response, job_id=job_id),
+        ("GET", f"/v1/jobs/{job_id}"): partial(_job_status_response, final_url=final_url, manifest_url=manifest_url),
+        ("GET", final_url): partial(_stream_response, content_type="text/csv", chunks=chunks),
+    }
+    if manifest_url:
+        routes[("GET", manifest_url)] = partial(
+            _stream_response, content_type="application/octet-stream", chunks=manifest_chunks
+        )
+    return routes
+
+
+def _job_route_suffix(request: httpx.Request) -> str:
+    return "/" + "/".join(request.url.path.split("/")[-3:])
+
+
+def _job_submit_response(request: httpx.Request, job_id: str) -> httpx.Response:
+    return httpx.Response(202, json={"job_id": job_id}, request=request)
+
+
+def _job_status_response(request: httpx.Request, final_url: str, manifest_url: str | None) -> httpx.Response:
     payload = {"status": "SUCCEEDED", "final_url": final_url}
     if manifest_url:
         payload["manifest_url"] = manifest_url
     return httpx.Response(200, json=payload, request=request)
 
 
-def _job_download_response(
-    request: httpx.Request,
-    final_url: str,
-    manifest_url: str | None,
-    chunks: Sequence[bytes],
-    manifest_chunks: Sequence[bytes],
-) -> httpx.Response | None:
-    if request.method != "GET":
-        return None
-    target = str(request.url)
-    if target == manifest_url:
-        return httpx.Response(
-            200,
-            headers={"Content-Type": "application/octet-stream"},
-            stream=_ChunkStream(manifest_chunks),
-            request=request,
-        )
-    if target != final_url:
-        return None
+def _stream_response(request: httpx.Request, content_type: str, chunks: Sequence[bytes]) -> httpx.Response:
     return httpx.Response(
         200,
-        headers={"Content-Type": "text/csv"},
+        headers={"Content-Type": content_type},
         stream=_ChunkStream(chunks),
         request=request,
     )
 
 
-def _resolve_job_response(
-    request: httpx.Request,
-    job_id: str,
-    final_url: str,
-    manifest_url: str | None,
-    chunks: Sequence[bytes],
-    manifest_chunks: Sequence[bytes],
-) -> httpx.Response | None:
-    response = _job_submit_response(request, job_id)
-    if response is not None:
-        return response
-    response = _job_status_response(request, job_id, final_url, manifest_url)
-    if response is not None:
-        return response
-    return _job_download_response(request, final_url, manifest_url, chunks, manifest_chunks)
-
-
 def paginated_pv_responses(
     pages: Sequence[Sequence[Mapping[str, object]]],
+    page_size: int = 1000,
+    etag: str | None = None,
 ) -> MockTransportCapture:
-    """Return a mock transport that returns paginated PV responses.
+    """Return a mock transport that serves PV pages by their offset query param.
 
-    'why': test get_pv_set auto-pagination across multiple pages
+    'why': test get_pv_set auto-pagination; pages may be requested concurrently and
+    therefore arrive in any order
     """
 
     recorded: list[httpx.Request] = []
-    call_count = [0]
+    total = sum(len(page) for page in pages)
+    headers = {"ETag": etag} if etag else None
 
     async def handler(request: httpx.Request) -> httpx.Response:
         recorded.append(request)
-        page_index = call_count[0]
-        call_count[0] += 1
-
-        if page_index >= len(pages):
-            payload: dict[str, object] = {"total": 0, "items": []}
-        else:
-            page = pages[page_index]
-            payload = {"total": len(page), "items": list(page)}
-
-        return httpx.Response(200, json=payload, request=request)
+        page_index = int(cast(str, request.url.params.get("offset", "0"))) // page_size
+        items = list(pages[page_index]) if page_index < len(pages) else []
+        return httpx.Response(200, json={"total": total, "items": items}, headers=headers, request=request)
 
     return MockTransportCapture(httpx.MockTransport(handler), recorded)
@@ -4,19 +4,37 @@
 """
 from __future__ import annotations
 
+import copy
+import json
 from pathlib import Path
 from typing import cast
 
 import pytest
 
-from netrias_client import NetriasClient
+from netrias_client import Environment, NetriasClient
+from netrias_client._config import build_settings
+from netrias_client._data_model_store import clear_lookup_cache
+from netrias_client._models import Settings
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def fresh_dms_lookup_cache() -> None:
+    """Start every test with an empty Data Model Store lookup cache.
+
+    'why': the cache is process-wide, so a PV set fetched in one test would otherwise
+    mask the mock transport installed by the next
+    """
+
+    clear_lookup_cache()
+
+
+@pytest.fixture(scope="session")
 def configured_client() -> NetriasClient:
     """Return a client configured with deterministic credentials.
 
-    'why': provide a ready-to-use setup for discovery and harmonization scenarios
+    'why': provide a ready-to-use setup for discovery and harmonization scenarios; the
+    client opens HTTP clients per operation, so one instance serves every test as long
+    as tests never call configure() on it (use token_client for that)
     """
 
     client = NetriasClient(api_key="test-api-key")
@@ -29,6 +47,40 @@ def configured_client() -> NetriasClient:
 
 
 @pytest.fixture
+def token_client() -> NetriasClient:
+    """Return a client with default settings and a placeholder API key.
+
+    'why': configuration tests start from an untouched client and mutate it via configure()
+    """
+
+    return NetriasClient(api_key="token")
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Settings:
+    """Return settings resolved without an environment.
+
+    'why': Settings is frozen and build_settings touches no global state, so read-only tests can share one
+    """
+
+    return build_settings(api_key="key")
+
+
+@pytest.fixture(scope="session")
+def prod_settings() -> Settings:
+    """Return settings resolved for the prod environment."""
+
+    return build_settings(api_key="key", environment=Environment.PROD)
+
+
+@pytest.fixture(scope="session")
+def staging_settings() -> Settings:
+    """Return settings resolved for the staging environment."""
+
+    return build_settings(api_key="key", environment=Environment.STAGING)
+
+
+@pytest.fixture(scope="session")
 def sample_csv_path() -> Path:
     """Return the canonical CSV fixture path.
 
@@ -38,28 +90,28 @@ def sample_csv_path() -> Path:
     return Path(__file__).parent / "fixtures" / "sample.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_middle_csv_path() -> Path:
     """Return a CSV fixture with an all-empty middle column."""
 
     return Path(__file__).parent / "fixtures" / "empty_middle.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tsv_path() -> Path:
     """Return the canonical TSV fixture path."""
 
     return Path(__file__).parent / "fixtures" / "sample.tsv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def duplicate_headers_tsv_path() -> Path:
     """Return a TSV fixture with duplicate display headers."""
 
     return Path(__file__).parent / "fixtures" / "duplicate_headers.tsv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_manifest_path() -> Path:
     """Return the canonical manifest JSON path.
 
@@ -73,18 +125,37 @@ def sample_manifest_path() -> Path:
 def output_directory(tmp_path: Path) -> Path:
     """Provide an empty directory for harmonization outputs.
 
-    'why': avoid polluting the repository root during tests
+    'why': avoid polluting the repository root during tests; the directory must
+    exist because harmonize treats a missing output_path as a file name
     """
 
     dest = tmp_path / "outputs"
-    dest.mkdir(parents=True, exist_ok=True)
+    dest.mkdir()
     return dest
 
 
-@pytest.fixture
-def sample_manifest_mapping(sample_manifest_path: Path) -> dict[str, object]:
-    """Return the manifest payload as a Python mapping."""
+@pytest.fixture(scope="session")
+def parsed_sample_manifest(sample_manifest_path: Path) -> dict[str, object]:
+    """Parse the manifest fixture once per session.
 
-    import json
+    'why': callers receive deep copies, so the parsed original is never mutated
+    """
 
     return cast(dict[str, object], json.loads(sample_manifest_path.read_text(encoding="utf-8")))
+
+
+@pytest.fixture(scope="session")
+def sample_manifest_written_bytes(parsed_sample_manifest: dict[str, object]) -> bytes:
+    """Return the bytes harmonize writes for `sample_manifest_mapping`.
+
+    'why': manifest files are written as indent=2 JSON; tests compare bytes instead of re-parsing
+    """
+
+    return json.dumps(parsed_sample_manifest, indent=2).encode("utf-8")
+
+
+@pytest.fixture
+def sample_manifest_mapping(parsed_sample_manifest: dict[str, object]) -> dict[str, object]:
+    """Return the manifest payload as a Python mapping."""
+
+    return copy.deepcopy(parsed_sample_manifest)
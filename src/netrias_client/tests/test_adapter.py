@@ -13,9 +13,18 @@ from typing import cast
 
 import pytest
 
-from netrias_client._adapter import REQUIRED_RECORD_KEYS, normalize_manifest_mapping
+from netrias_client._adapter import (
+    REQUIRED_RECORD_KEYS,
+    build_column_mapping_payload,
+    normalize_manifest_mapping,
+)
 from netrias_client._errors import MappingValidationError
-from netrias_client._models import ColumnMappingRecord
+from netrias_client._models import (
+    ColumnMappingRecord,
+    MappingDiscoveryResult,
+    MappingRecommendationOption,
+    MappingSuggestion,
+)
 
 
 def _complete_entry() -> ColumnMappingRecord:
@@ -157,3 +166,49 @@ def test_entry_missing_any_single_required_key_raises_boundary_error(omitted_key
     with pytest.raises(MappingValidationError) as exc_info:
         _ = normalize_manifest_mapping(manifest)
     assert omitted_key in str(exc_info.value)
+
+
+def _option(target: str, confidence: float | None, cde_id: int) -> MappingRecommendationOption:
+    return MappingRecommendationOption(
+        target=target, confidence=confidence, harmonization="harmonizable", target_cde_id=cde_id
+    )
+
+
+def test_top_option_picks_first_highest_score_at_or_above_threshold() -> None:
+    """The manifest entry uses the first option with the highest eligible confidence.
+
+    'why': the single-pass selection must keep max()'s first-wins tie behaviour
+    and treat a score equal to the threshold as eligible.
+    """
+
+    # Given — a tie at the top plus one option below threshold and one unscored
+    options = (
+        _option("below", 0.4, 1),
+        _option("unscored", None, 2),
+        _option("first_top", 0.8, 3),
+        _option("second_top", 0.8, 4),
+    )
+    suggestion = MappingSuggestion(source_column="dx", options=options, raw={}, column_id=0)
+    result = MappingDiscoveryResult(schema="gc", suggestions=(suggestion,), raw={})
+
+    # When — the payload is built with the threshold equal to the top score
+    payload = build_column_mapping_payload(result, threshold=0.8, column_count=1)
+
+    # Then — the first of the tied options wins
+    entry = payload["column_mappings"][0]
+    assert entry is not None
+    assert entry["cde_key"] == "first_top"
+    assert entry["cde_id"] == 3
+
+
+def test_top_option_returns_none_slot_when_nothing_meets_threshold() -> None:
+    """No eligible option leaves a None placeholder in the column slot."""
+
+    suggestion = MappingSuggestion(
+        source_column="dx", options=(_option("low", 0.5, 1),), raw={}, column_id=0
+    )
+    result = MappingDiscoveryResult(schema="gc", suggestions=(suggestion,), raw={})
+
+    payload = build_column_mapping_payload(result, threshold=0.9, column_count=1)
+
+    assert payload["column_mappings"] == [None]
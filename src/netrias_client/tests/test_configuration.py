@@ -4,7 +4,9 @@
 """
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
+from typing import cast
 
 import pytest
 
@@ -17,6 +19,10 @@ from netrias_client._config import (
     build_settings,
 )
 from netrias_client._errors import ClientConfigurationError
+from netrias_client._models import Settings
+
+_PROD_URLS = _ENVIRONMENT_URLS[Environment.PROD]
+_STAGING_URLS = _ENVIRONMENT_URLS[Environment.STAGING]
 
 
 def test_init_rejects_blank_api_key() -> None:
@@ -28,74 +34,62 @@ def test_init_rejects_blank_api_key() -> None:
     assert "api_key must be a non-empty string" in str(exc.value)
 
 
-def test_configure_accepts_url_overrides() -> None:
+def test_configure_accepts_url_overrides(token_client: NetriasClient) -> None:
     """URL overrides for testing/staging are supported."""
 
     # Given a client with default URLs
-    client = NetriasClient(api_key="token")
 
     # When configuring with custom URLs
-    client.configure(
+    token_client.configure(
         discovery_url="https://staging.example.com/discovery",
         harmonization_url="https://staging.example.com/harmonize",
         data_model_store_url="https://staging.example.com/dms",
     )
 
     # Then the URLs are updated
-    assert client.settings.discovery_url == "https://staging.example.com/discovery"
-    assert client.settings.harmonization_url == "https://staging.example.com/harmonize"
-    assert client.settings.data_model_store_endpoints is not None
-    assert client.settings.data_model_store_endpoints.base_url == "https://staging.example.com/dms"
-
-
-def test_configure_rejects_unsupported_log_level() -> None:
-    """Unsupported log levels are rejected immediately."""
-
-    client = NetriasClient(api_key="token")
-    with pytest.raises(ClientConfigurationError) as exc:
-        client.configure(log_level="VERBOSE")
-
-    assert "unsupported log_level" in str(exc.value)
-
-
-def test_configure_rejects_non_positive_timeout() -> None:
-    """Non-positive timeouts trigger configuration errors."""
-
-    client = NetriasClient(api_key="token")
-    with pytest.raises(ClientConfigurationError) as exc:
-        client.configure(timeout=0.0)
-
-    assert "timeout must be positive" in str(exc.value)
-
-
-def test_configure_rejects_invalid_log_level_string() -> None:
-    """Invalid log level strings are rejected with a descriptive message."""
+    assert token_client.settings.discovery_url == "https://staging.example.com/discovery"
+    assert token_client.settings.harmonization_url == "https://staging.example.com/harmonize"
+    assert token_client.settings.data_model_store_endpoints is not None
+    assert token_client.settings.data_model_store_endpoints.base_url == "https://staging.example.com/dms"
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected_fragment"),
+    [
+        ({"log_level": "VERBOSE"}, "unsupported log_level"),
+        ({"log_level": "TRACE"}, "unsupported log_level"),
+        ({"timeout": 0.0}, "timeout must be positive"),
+        ({"discovery_bypass_batch_size": 0}, "discovery_bypass_batch_size must be a positive integer"),
+    ],
+    ids=["unsupported-log-level", "invalid-log-level-string", "non-positive-timeout", "non-positive-batch-size"],
+)
+def test_configure_rejects_invalid_values(
+    token_client: NetriasClient, overrides: dict[str, object], expected_fragment: str
+) -> None:
+    """Invalid configure() values are rejected immediately with a descriptive message."""
 
-    client = NetriasClient(api_key="token")
     with pytest.raises(ClientConfigurationError) as exc:
-        client.configure(log_level="TRACE")
+        token_client.configure(**overrides)  # pyright: ignore[reportArgumentType]
 
-    assert "unsupported log_level" in str(exc.value)
+    assert expected_fragment in str(exc.value)
 
 
-def test_configure_accepts_log_level_string() -> None:
+def test_configure_accepts_log_level_string(token_client: NetriasClient) -> None:
     """Log level accepts string values and persists them on settings."""
 
-    client = NetriasClient(api_key="token")
-    client.configure(log_level="DEBUG")
-    assert client.settings.log_level.value == "DEBUG"
+    token_client.configure(log_level="DEBUG")
+    assert token_client.settings.log_level.value == "DEBUG"
 
 
-def test_configure_creates_log_directory(tmp_path: Path) -> None:
+def test_configure_creates_log_directory(token_client: NetriasClient, tmp_path: Path) -> None:
     """Providing a log directory ensures it is created and stored on settings."""
 
-    client = NetriasClient(api_key="token")
     target = tmp_path / "logs"
 
-    client.configure(log_directory=target)
+    token_client.configure(log_directory=target)
 
     assert target.exists()
-    assert client.settings.log_directory == target
+    assert token_client.settings.log_directory == target
 
 
 def test_configure_preserves_api_key() -> None:
@@ -108,23 +102,51 @@ def test_configure_preserves_api_key() -> None:
     assert client.settings.timeout == 100.0
 
 
-def test_configure_preserves_unspecified_settings() -> None:
+def test_configure_preserves_unspecified_settings(token_client: NetriasClient) -> None:
     """Calling configure() with partial parameters preserves other settings.
 
     'why': users expect incremental configuration, not full replacement
     """
 
     # Given a client with custom timeout and log_directory
-    client = NetriasClient(api_key="token")
-    client.configure(timeout=100.0, discovery_use_gateway_bypass=False)
+    token_client.configure(timeout=100.0, discovery_use_gateway_bypass=False)
 
     # When configuring only log_level
-    client.configure(log_level="DEBUG")
+    token_client.configure(log_level="DEBUG")
 
     # Then timeout and discovery_use_gateway_bypass are preserved
-    assert client.settings.timeout == 100.0
-    assert client.settings.discovery_use_gateway_bypass is False
-    assert client.settings.log_level.value == "DEBUG"
+    assert token_client.settings.timeout == 100.0
+    assert token_client.settings.discovery_use_gateway_bypass is False
+    assert token_client.settings.log_level.value == "DEBUG"
+
+
+def test_settings_snapshot_is_shared_until_configure(token_client: NetriasClient) -> None:
+    """Repeated reads return the same frozen snapshot; configure() swaps it.
+
+    'why': settings are immutable, so reads should not pay for a copy each time
+    """
+
+    before = token_client.settings
+
+    assert token_client.settings is before
+
+    token_client.configure(timeout=50.0)
+
+    assert token_client.settings is not before
+    assert before.timeout != token_client.settings.timeout
+
+
+def test_configure_rejects_http2_without_h2(token_client: NetriasClient) -> None:
+    """Opting into HTTP/2 without the `http2` extra fails at configuration time."""
+
+    if importlib.util.find_spec("h2") is not None:
+        pytest.skip("h2 is installed")
+
+    with pytest.raises(ClientConfigurationError) as exc:
+        token_client.configure(http2=True)
+
+    assert "h2" in str(exc.value)
+    assert token_client.settings.http2 is False
 
 
 # ---------------------------------------------------------------------------
@@ -132,31 +154,28 @@ def test_configure_preserves_unspecified_settings() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_environment_prod_resolves_urls() -> None:
-    """Environment.PROD selects prod URL defaults.
+@pytest.mark.parametrize(
+    ("settings_fixture", "expected_urls"),
+    [("prod_settings", _PROD_URLS), ("staging_settings", _STAGING_URLS)],
+    ids=["prod", "staging"],
+)
+def test_environment_resolves_urls(
+    request: pytest.FixtureRequest, settings_fixture: str, expected_urls: dict[str, str]
+) -> None:
+    """Each Environment selects its URL defaults.
 
     Given: No individual URL overrides provided
-    When: build_settings() is called with environment=PROD
-    Then: URLs match the prod environment registry
+    When: build_settings() is called with an environment
+    Then: URLs match that environment's registry entry
     """
     # Given / When
-    settings = build_settings(api_key="key", environment=Environment.PROD)
+    settings = cast(Settings, request.getfixturevalue(settings_fixture))
 
     # Then
-    prod = _ENVIRONMENT_URLS[Environment.PROD]
-    assert settings.harmonization_url == prod["harmonization"]
-    assert settings.discovery_url == prod["discovery"]
+    assert settings.harmonization_url == expected_urls["harmonization"]
+    assert settings.discovery_url == expected_urls["discovery"]
     assert settings.data_model_store_endpoints is not None
-    assert settings.data_model_store_endpoints.base_url == prod["data_model_store"]
-
-
-def test_environment_staging_resolves_urls() -> None:
-    """Environment.STAGING selects staging URL defaults."""
-    settings = build_settings(api_key="key", environment=Environment.STAGING)
-
-    staging = _ENVIRONMENT_URLS[Environment.STAGING]
-    assert settings.harmonization_url == staging["harmonization"]
-    assert settings.discovery_url == staging["discovery"]
+    assert settings.data_model_store_endpoints.base_url == expected_urls["data_model_store"]
 
 
 def test_environment_url_overridden_by_explicit_param() -> None:
@@ -170,16 +189,14 @@ def test_environment_url_overridden_by_explicit_param() -> None:
 
     assert settings.harmonization_url == custom
     # Other URLs still come from staging
-    staging = _ENVIRONMENT_URLS[Environment.STAGING]
-    assert settings.discovery_url == staging["discovery"]
+    assert settings.discovery_url == _STAGING_URLS["discovery"]
 
 
 def test_client_init_with_environment() -> None:
     """NetriasClient accepts environment param and resolves URLs accordingly."""
     client = NetriasClient(api_key="key", environment=Environment.PROD)
 
-    prod = _ENVIRONMENT_URLS[Environment.PROD]
-    assert client.settings.harmonization_url == prod["harmonization"]
+    assert client.settings.harmonization_url == _PROD_URLS["harmonization"]
 
 
 # ---------------------------------------------------------------------------
@@ -187,16 +204,14 @@ def test_client_init_with_environment() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_no_environment_preserves_defaults() -> None:
+def test_no_environment_preserves_defaults(default_settings: Settings) -> None:
     """No environment parameter preserves current default URLs (backward compatible).
 
     Given: No environment parameter passed
     When: build_settings() is called
     Then: URLs match the legacy module-level constants (no behavior change)
     """
-    settings = build_settings(api_key="key")
-
-    assert settings.discovery_url == DISCOVERY_BASE_URL
-    assert settings.harmonization_url == HARMONIZATION_BASE_URL
-    assert settings.data_model_store_endpoints is not None
-    assert settings.data_model_store_endpoints.base_url == DATA_MODEL_STORE_BASE_URL
+    assert default_settings.discovery_url == DISCOVERY_BASE_URL
+    assert default_settings.harmonization_url == HARMONIZATION_BASE_URL
+    assert default_settings.data_model_store_endpoints is not None
+    assert default_settings.data_model_store_endpoints.base_url == DATA_MODEL_STORE_BASE_URL
@@ -5,12 +5,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+from functools import partial
+from pathlib import Path
+from typing import cast
 
 import httpx
 import pytest
 
 from netrias_client import CDE, DataModel, DataModelStoreError, DataModelVersion, NetriasClient
+from netrias_client._data_model_store import PV_FETCH_CONCURRENCY, get_pv_set_async
 from netrias_client._errors import NetriasAPIUnavailable
+from netrias_client._http import shared_client_scope
 
 from ._utils import (
     EXTERNAL_VERSION_NUMBER,
@@ -192,6 +199,253 @@ def test_get_pv_set_returns_frozenset(configured_client: NetriasClient, monkeypa
     assert "InvalidValue" not in pv_set
 
 
+def test_get_pv_set_memoizes_until_cache_cleared(configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve repeat PV lookups from the process cache until it is cleared.
+
+    'why': PV sets are immutable within a published version; validation loops should not refetch
+    """
+
+    # Given
+    payload = {"total": 1, "items": [{"pv_id": 1, "value": "Male", "description": None, "is_active": True}]}
+    capture = json_success(payload)
+    install_mock_transport(monkeypatch, capture)
+
+    # When
+    first = configured_client.get_pv_set("ccdi", "v1", "sex_at_birth")
+    second = configured_client.get_pv_set("ccdi", "v1", "sex_at_birth")
+
+    # Then
+    assert first is second
+    assert len(capture.requests) == 1
+
+    configured_client.clear_dms_cache()
+    _ = configured_client.get_pv_set("ccdi", "v1", "sex_at_birth")
+    assert len(capture.requests) == 2
+
+
+def test_concurrent_get_pv_set_calls_share_one_fetch(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Coalesce concurrent lookups of one PV set onto a single in-flight fetch.
+
+    'why': validating many rows concurrently must not multiply requests per CDE
+    """
+
+    # Given
+    payload = {"total": 1, "items": [{"pv_id": 1, "value": "Male", "description": None, "is_active": True}]}
+    capture = json_success(payload)
+    install_mock_transport(monkeypatch, capture)
+
+    async def lookup_many() -> list[frozenset[str]]:
+        return list(await asyncio.gather(*(configured_client.get_pv_set_async("ccdi", "v1", "sex") for _ in range(50))))
+
+    # When
+    results = asyncio.run(lookup_many())
+
+    # Then
+    assert all("Male" in pv_set for pv_set in results)
+    assert len(capture.requests) == 1
+
+
+async def _held_first_page(
+    recorded: list[httpx.Request], started: asyncio.Event, release: asyncio.Event, request: httpx.Request
+) -> httpx.Response:
+    """Serve a 1001-value PV set, holding the first page until `release` is set."""
+
+    recorded.append(request)
+    offset = int(cast(str, request.url.params.get("offset", "0")))
+    if offset == 0:
+        started.set()
+        _ = await release.wait()
+    items = [{"pv_id": i, "value": f"Value{i}", "is_active": True} for i in range(offset, min(offset + 1000, 1001))]
+    return httpx.Response(200, json={"total": 1001, "items": items}, request=request)
+
+
+def test_coalesced_pv_fetch_survives_cancellation_of_initiating_waiter(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A shared PV fetch keeps working after the waiter that started it is cancelled.
+
+    'why': the fetch must not run on the initiating waiter's scoped client, which that
+    waiter's cancellation closes while other waiters still depend on the fetch
+    """
+
+    # Given: a two-page PV set whose first page is held until the initiator is cancelled
+    recorded: list[httpx.Request] = []
+    first_page_started = asyncio.Event()
+    release_first_page = asyncio.Event()
+    handler = partial(_held_first_page, recorded, first_page_started, release_first_page)
+    install_mock_transport(monkeypatch, MockTransportCapture(httpx.MockTransport(handler), recorded))
+    settings = configured_client.settings
+
+    async def initiator() -> frozenset[str]:
+        async with shared_client_scope(settings.timeout):
+            return await get_pv_set_async(settings, "ccdi", "v1", "sex")
+
+    async def scenario() -> frozenset[str]:
+        first = asyncio.create_task(initiator())
+        _ = await first_page_started.wait()
+        joiner = asyncio.create_task(get_pv_set_async(settings, "ccdi", "v1", "sex"))
+        await asyncio.sleep(0)
+        _ = first.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            _ = await first
+        release_first_page.set()
+        return await joiner
+
+    # When: the initiating waiter is cancelled mid-fetch
+    pv_set = asyncio.run(scenario())
+
+    # Then: the remaining waiter still receives the complete set from one fetch
+    assert len(pv_set) == 1001
+    assert sorted(request.url.params["offset"] for request in recorded) == ["0", "1000"]
+
+
+def test_validate_values_bulk_fetches_each_cde_once(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Answer many checks across two CDEs with one PV request per CDE.
+
+    'why': bulk validation must scale with distinct CDEs, not with values checked
+    """
+
+    # Given: two CDEs with distinct permissible values
+    permissible = {"sex": ["Male", "Female"], "site": ["Lung"]}
+    recorded: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        recorded.append(request)
+        cde_key = request.url.path.rstrip("/").split("/")[-2]
+        items = [{"pv_id": i, "value": value, "is_active": True} for i, value in enumerate(permissible[cde_key])]
+        return httpx.Response(200, json={"total": len(items), "items": items}, request=request)
+
+    install_mock_transport(monkeypatch, MockTransportCapture(httpx.MockTransport(handler), recorded))
+    checks = [(value, "ccdi", "v1", cde_key) for value, cde_key in [("Male", "sex"), ("Lung", "site"), ("Other", "sex")] * 3]
+    checks.append(("Female", "ccdi", "v1", "sex"))
+
+    # When
+    results = configured_client.validate_values_bulk(checks)
+
+    # Then
+    assert results == (True, True, False) * 3 + (True,)
+    assert len(recorded) == 2
+
+
+async def _gauged_single_value_pv(in_flight: list[int], peak: list[int], request: httpx.Request) -> httpx.Response:
+    """Answer with the CDE key as its only PV, recording the peak number of concurrent requests."""
+
+    in_flight[0] += 1
+    peak[0] = max(peak[0], in_flight[0])
+    await asyncio.sleep(0.01)
+    in_flight[0] -= 1
+    cde_key = request.url.path.rstrip("/").split("/")[-2]
+    items = [{"pv_id": 0, "value": cde_key, "is_active": True}]
+    return httpx.Response(200, json={"total": 1, "items": items}, request=request)
+
+
+def test_validate_values_bulk_bounds_concurrent_cde_fetches(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep at most PV_FETCH_CONCURRENCY PV fetches in flight across many CDEs.
+
+    'why': a batch spanning hundreds of CDEs must not open a connection per CDE at once
+    """
+
+    # Given: more distinct CDEs than the fan-out limit, each answered after a short delay
+    cde_keys = [f"cde{i}" for i in range(PV_FETCH_CONCURRENCY * 3)]
+    in_flight, peak = [0], [0]
+    handler = partial(_gauged_single_value_pv, in_flight, peak)
+    install_mock_transport(monkeypatch, MockTransportCapture(httpx.MockTransport(handler), []))
+    checks = [(cde_key, "ccdi", "v1", cde_key) for cde_key in cde_keys] + [("nope", "ccdi", "v1", "cde0")]
+
+    # When
+    results = configured_client.validate_values_bulk(checks)
+
+    # Then
+    assert results == (True,) * len(cde_keys) + (False,)
+    assert 1 < peak[0] <= PV_FETCH_CONCURRENCY
+
+
+def test_get_pv_set_revalidates_disk_cache_with_etag(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Persist PV sets with their ETag and reuse them after a 304.
+
+    'why': a new process should pay one conditional request instead of full pagination
+    """
+
+    # Given: a server that answers 304 when the client already holds ETag "v1"
+    recorded: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        recorded.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, request=request)
+        items = [{"pv_id": 1, "value": "Male", "is_active": True}]
+        return httpx.Response(200, json={"total": 1, "items": items}, headers={"ETag": '"v1"'}, request=request)
+
+    install_mock_transport(monkeypatch, MockTransportCapture(httpx.MockTransport(handler), recorded))
+    client = NetriasClient(api_key="test-api-key")
+    client.configure(timeout=5, pv_cache_directory=tmp_path)
+
+    # When: the set is fetched, then looked up again as a fresh process would
+    first = client.get_pv_set("ccdi", "v1", "sex")
+    client.clear_dms_cache()
+    second = client.get_pv_set("ccdi", "v1", "sex")
+
+    # Then
+    assert first == second == frozenset({"Male"})
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert [request.headers.get("If-None-Match") for request in recorded] == [None, '"v1"']
+
+
+def test_get_pv_set_does_not_persist_multi_page_sets(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Skip the disk cache for sets spanning several pages.
+
+    'why': the ETag covers only the first page, so a 304 cannot vouch for later pages
+    """
+
+    # Given: a two-page PV set served with an ETag
+    pages = [
+        [{"pv_id": i, "value": f"Value{i}", "is_active": True} for i in range(start, stop)]
+        for start, stop in ((0, 1000), (1000, 1001))
+    ]
+    capture = paginated_pv_responses(pages, etag='"v1"')
+    install_mock_transport(monkeypatch, capture)
+    client = NetriasClient(api_key="test-api-key")
+    client.configure(timeout=5, pv_cache_directory=tmp_path)
+
+    # When: the set is fetched, then looked up again as a fresh process would
+    first = client.get_pv_set("ccdi", "v1", "sex")
+    client.clear_dms_cache()
+    second = client.get_pv_set("ccdi", "v1", "sex")
+
+    # Then: nothing is persisted, so the second lookup refetches every page unconditionally
+    assert first == second
+    assert len(first) == 1001
+    assert list(tmp_path.glob("*.json")) == []
+    assert len(capture.requests) == 4
+    assert all("If-None-Match" not in request.headers for request in capture.requests)
+
+
+def test_list_cdes_memoizes_per_query(configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache CDE lists per distinct argument set.
+
+    'why': a different query or page must not be answered from another call's entry
+    """
+
+    # Given
+    payload = {"total": 1, "items": [{"cde_key": "sex_at_birth", "cde_id": 1, "cde_version_id": 1}]}
+    capture = json_success(payload)
+    install_mock_transport(monkeypatch, capture)
+
+    # When
+    _ = configured_client.list_cdes("ccdi", "v1")
+    _ = configured_client.list_cdes("ccdi", "v1")
+    _ = configured_client.list_cdes("ccdi", "v1", query="sex")
+
+    # Then
+    assert len(capture.requests) == 2
+
+
 def test_list_data_models_raises_on_client_error(configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """Raise DataModelStoreError on 4xx responses.
 
@@ -384,6 +638,93 @@ def test_get_pv_set_paginates_multiple_pages(configured_client: NetriasClient, m
     assert len(capture.requests) == 2
 
 
+def test_get_pv_set_fetches_remaining_pages_from_reported_total(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Request every page implied by the first page's total exactly once.
+
+    'why': remaining pages are fetched concurrently, so order of arrival is not guaranteed
+    """
+
+    # Given: three pages totalling 2500 PVs
+    pages = [
+        [{"pv_id": i, "value": f"Value{i}", "description": None, "is_active": True} for i in range(start, stop)]
+        for start, stop in ((0, 1000), (1000, 2000), (2000, 2500))
+    ]
+    capture = paginated_pv_responses(pages)
+    install_mock_transport(monkeypatch, capture)
+
+    # When
+    pv_set = configured_client.get_pv_set("ccdi", "v1", "large_cde")
+
+    # Then
+    assert len(pv_set) == 2500
+    assert sorted(request.url.params["offset"] for request in capture.requests) == ["0", "1000", "2000"]
+
+
+def test_get_pv_set_reuses_one_http_client_across_pages(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """All pages of one PV set are fetched through a single keep-alive client.
+
+    'why': a client per page forces a new connection handshake for every page
+    """
+
+    # Given: two pages of PVs and a counter on client construction
+    page1 = [{"pv_id": i, "value": f"Value{i}", "description": None, "is_active": True} for i in range(1000)]
+    page2 = [{"pv_id": 1000, "value": "Value1000", "description": None, "is_active": True}]
+    capture = paginated_pv_responses([page1, page2])
+    install_mock_transport(monkeypatch, capture)
+    constructed: list[object] = []
+    patched_client = httpx.AsyncClient
+
+    class _CountingAsyncClient(patched_client):
+        def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
+            constructed.append(self)
+            super().__init__(**kwargs)  # pyright: ignore[reportArgumentType]
+
+    monkeypatch.setattr("netrias_client._http.httpx.AsyncClient", _CountingAsyncClient)
+
+    # When: the full PV set is requested
+    pv_set = configured_client.get_pv_set("ccdi", "v1", "large_cde")
+
+    # Then: both pages were requested through one client
+    assert len(pv_set) == 1001
+    assert len(capture.requests) == 2
+    assert len(constructed) == 1
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["http1", "http2"])
+def test_get_pv_set_passes_http2_setting_to_shared_client(
+    configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch, http2: bool
+) -> None:
+    """The shared client negotiates HTTP/2 only when the setting asks for it.
+
+    'why': the wire protocol must follow configuration, not whether `h2` happens to be installed
+    """
+
+    # Given: a single PV page and a client class that records the http2 flag
+    capture = paginated_pv_responses([[{"pv_id": 1, "value": "Male", "is_active": True}]])
+    install_mock_transport(monkeypatch, capture)
+    requested: list[object] = []
+    patched_client = httpx.AsyncClient
+
+    class _RecordingAsyncClient(patched_client):
+        def __init__(self, **kwargs: object) -> None:  # type: ignore[override]
+            # 'why': the mock transport never speaks HTTP/2, so `h2` need not be installed
+            requested.append(kwargs.pop("http2", False))
+            super().__init__(**kwargs)  # pyright: ignore[reportArgumentType]
+
+    monkeypatch.setattr("netrias_client._http.httpx.AsyncClient", _RecordingAsyncClient)
+    settings = dataclasses.replace(configured_client.settings, http2=http2)
+
+    # When
+    _ = asyncio.run(get_pv_set_async(settings, "ccdi", "v1", "sex"))
+
+    # Then
+    assert requested == [http2]
+
+
 def test_list_data_models_sends_query_params(configured_client: NetriasClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """Query parameters are included in the data models request.
 
@@ -8,19 +8,42 @@ import base64
 import io
 import json
 import logging
+import threading
+import types
 from pathlib import Path
-from typing import cast
+from typing import Final, cast
 
 import httpx
 import pytest
 
 from netrias_client import ColumnKeyedManifestPayload, ColumnMappingRecord, NetriasClient, column_key_for_index
-from netrias_client._errors import MappingDiscoveryError, MappingValidationError, NetriasAPIUnavailable
-from netrias_client._gateway_bypass import invoke_cde_recommendation_alias
+from netrias_client._discovery import (
+    _collect_column_samples,  # pyright: ignore[reportPrivateUsage]
+    _option_from_mapping,  # pyright: ignore[reportPrivateUsage]
+)
+from netrias_client._errors import (
+    GatewayBypassError,
+    MappingDiscoveryError,
+    MappingValidationError,
+    NetriasAPIUnavailable,
+)
+from netrias_client._gateway_bypass import (
+    _build_lambda_client,  # pyright: ignore[reportPrivateUsage]
+    invoke_cde_recommendation_alias,
+)
 from netrias_client._models import ColumnSamples
 from netrias_client._sfn_discovery import discover_via_step_functions
 
-from ._utils import EXTERNAL_VERSION_NUMBER, install_mock_transport, json_failure, json_success, transport_error
+from ._utils import (
+    EXTERNAL_VERSION_NUMBER,
+    install_mock_transport,
+    json_failure,
+    json_object,
+    json_success,
+    proxy_event_body,
+    recommendation_request,
+    transport_error,
+)
 
 
 def _array_payload(results: list[dict[str, object]]) -> dict[str, object]:
@@ -44,6 +67,11 @@ def _column_slots(manifest: ColumnKeyedManifestPayload, column_count: int) -> li
     return [mappings.get(column_key_for_index(index)) for index in range(column_count)]
 
 
+# 'why': canned responses shared by several scenarios are serialized once per module
+_EMPTY_PROXY_RESPONSE: Final = json.dumps({"statusCode": 200, "body": json.dumps({"results": []})})
+_UNMATCHED_ABC_PAYLOAD: Final = _array_payload([{"column_name": name, "matches": []} for name in ("a", "b", "c")])
+
+
 class _RecordingLambdaClient:
     def __init__(self) -> None:
         self.payload: bytes | None = None
@@ -56,19 +84,17 @@ class _RecordingLambdaClient:
     ) -> dict[str, object]:
         _ = (FunctionName, Qualifier)
         self.payload = Payload
-        body = json.dumps({"results": []})
-        return {"StatusCode": 200, "Payload": io.BytesIO(json.dumps({"statusCode": 200, "body": body}).encode("utf-8"))}
+        return {"StatusCode": 200, "Payload": io.BytesIO(_EMPTY_PROXY_RESPONSE.encode("utf-8"))}
 
 
 class _SuccessfulStepFunctionsClient:
     def describe_execution(self, executionArn: str) -> dict[str, object]:
         assert executionArn == "arn:aws:states:us-east-2:123:execution:machine:run"
-        body = json.dumps({"results": []})
-        return {"status": "SUCCEEDED", "output": json.dumps({"statusCode": 200, "body": body})}
+        return {"status": "SUCCEEDED", "output": _EMPTY_PROXY_RESPONSE}
 
 
-def _sample_columns() -> list[ColumnSamples]:
-    return [{"column_name": "diagnosis", "values": ["glioma"]}]
+# 'why': built once per module; the transports under test only read the samples
+_SAMPLE_COLUMNS: Final[tuple[ColumnSamples, ...]] = ({"column_name": "diagnosis", "values": ["glioma"]},)
 
 
 def test_discover_mapping_from_tabular_success(
@@ -123,7 +149,7 @@ def test_discover_mapping_from_tabular_success(
     # And: the outbound request sends the public external-version contract to discovery
     request = capture.requests[0]
     assert request.headers.get("x-api-key") == "test-api-key"
-    content = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
+    content = recommendation_request(request.content)
     assert content.get("target_schema") == "ccdi"
     assert content.get("external_version_number") == EXTERNAL_VERSION_NUMBER
 
@@ -145,7 +171,7 @@ def test_gateway_bypass_lambda_proxy_body_preserves_discovery_request(
         return lambda_client
 
     monkeypatch.setattr("netrias_client._gateway_bypass._build_lambda_client", build_lambda_client)
-    columns = _sample_columns()
+    columns = list(_SAMPLE_COLUMNS)
 
     # When: discovery invokes the Lambda alias directly
     _ = invoke_cde_recommendation_alias(
@@ -157,16 +183,131 @@ def test_gateway_bypass_lambda_proxy_body_preserves_discovery_request(
 
     # Then: the Lambda proxy event body carries the current public request contract
     assert lambda_client.payload is not None
-    event = cast(dict[str, object], json.loads(lambda_client.payload.decode("utf-8")))
-    body = event.get("body")
-    assert isinstance(body, str)
-    content = cast(dict[str, object], json.loads(body))
+    content = proxy_event_body(lambda_client.payload)
     assert content.get("target_schema") == "gc"
     assert content.get("external_version_number") == EXTERNAL_VERSION_NUMBER
     assert content.get("columns") == columns
     assert content.get("top_k") == 5
 
 
+class _EchoingLambdaClient:
+    """Answer each invocation with one empty-match result per requested column."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def invoke(self, FunctionName: str, Payload: bytes, Qualifier: str = "") -> dict[str, object]:
+        _ = (FunctionName, Qualifier)
+        body = proxy_event_body(Payload)
+        names = [column["column_name"] for column in body["columns"]]
+        with self._lock:
+            self.batches.append(names)
+        results: list[dict[str, object]] = [{"column_name": name, "matches": []} for name in names]
+        proxy = {"statusCode": 200, "body": json.dumps({"results": results})}
+        return {"StatusCode": 200, "Payload": io.BytesIO(json.dumps(proxy).encode("utf-8"))}
+
+
+def test_gateway_bypass_fans_out_column_batches_and_preserves_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Wide requests are split into batches whose results are merged in column order.
+
+    'why': the response index is the column_id downstream, so concurrent batches must
+    not reorder results
+    """
+
+    # Given: five columns and a batch size of two
+    lambda_client = _EchoingLambdaClient()
+    def _fake_build(**_: object) -> _EchoingLambdaClient:
+        return lambda_client
+
+    monkeypatch.setattr("netrias_client._gateway_bypass._build_lambda_client", _fake_build)
+    columns = [ColumnSamples(column_name=f"col_{index}", values=["x"]) for index in range(5)]
+
+    # When: the bypass is invoked with batching enabled
+    payload = invoke_cde_recommendation_alias(
+        target_schema="gc",
+        external_version_number=EXTERNAL_VERSION_NUMBER,
+        columns=columns,
+        batch_size=2,
+    )
+
+    # Then: three invocations were made and results line up with the input columns
+    assert sorted(len(batch) for batch in lambda_client.batches) == [1, 2, 2]
+    results = cast(list[dict[str, object]], payload["results"])
+    assert [result["column_name"] for result in results] == [f"col_{index}" for index in range(5)]
+
+
+class _ResultlessLambdaClient:
+    def invoke(self, FunctionName: str, Payload: bytes, Qualifier: str = "") -> dict[str, object]:
+        _ = (FunctionName, Payload, Qualifier)
+        proxy = {"statusCode": 200, "body": json.dumps({"target_schema": "gc"})}
+        return {"StatusCode": 200, "Payload": io.BytesIO(json.dumps(proxy).encode("utf-8"))}
+
+
+def test_gateway_bypass_rejects_batch_without_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A batch response lacking `results` fails loudly instead of being dropped."""
+
+    # Given: a Lambda that answers every batch without a results array
+    lambda_client = _ResultlessLambdaClient()
+
+    def _fake_build(**_: object) -> _ResultlessLambdaClient:
+        return lambda_client
+
+    monkeypatch.setattr("netrias_client._gateway_bypass._build_lambda_client", _fake_build)
+    columns = [ColumnSamples(column_name=f"col_{index}", values=["x"]) for index in range(3)]
+
+    # When / Then: the batched invocation raises the malformed-response error
+    with pytest.raises(GatewayBypassError, match="missing 'results' array"):
+        _ = invoke_cde_recommendation_alias(
+            target_schema="gc",
+            external_version_number=EXTERNAL_VERSION_NUMBER,
+            columns=columns,
+            batch_size=2,
+        )
+
+
+def test_gateway_bypass_reuses_lambda_client_for_same_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated bypass invocations reuse one keep-alive boto3 client per region/profile/timeout."""
+
+    # Given: a fake boto3 module that counts client construction
+    built: list[str] = []
+    configs: list[object] = []
+
+    def client(service_name: str, **kwargs: object) -> object:
+        built.append(service_name)
+        configs.append(kwargs.get("config"))
+        return object()
+
+    fake_boto3 = types.SimpleNamespace(client=client)
+    monkeypatch.setattr(
+        "netrias_client._gateway_bypass._load_boto_dependencies", lambda: (fake_boto3, dict)
+    )
+    _build_lambda_client.cache_clear()
+
+    # When: the client is requested twice with the same settings and once with another timeout
+    first = _build_lambda_client(region_name="us-east-2", profile_name=None, timeout_seconds=30.0)
+    second = _build_lambda_client(region_name="us-east-2", profile_name=None, timeout_seconds=30.0)
+    other = _build_lambda_client(region_name="us-east-2", profile_name=None, timeout_seconds=60.0)
+    _build_lambda_client.cache_clear()
+
+    # Then: only distinct settings construct a new client
+    assert first is second
+    assert other is not first
+    assert built == ["lambda", "lambda"]
+    assert configs[0] == {
+        "tcp_keepalive": True,
+        "max_pool_connections": 10,
+        "read_timeout": 30.0,
+        "connect_timeout": 10.0,
+    }
+
+
 def test_step_functions_encoded_payload_preserves_discovery_request(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -190,7 +331,7 @@ def test_step_functions_encoded_payload_preserves_discovery_request(
             super().__init__(**kwdict)  # pyright: ignore[reportArgumentType]
 
     monkeypatch.setattr("netrias_client._sfn_discovery.httpx.Client", PatchedClient)
-    columns = _sample_columns()
+    columns = list(_SAMPLE_COLUMNS)
 
     def boto_client(service_name: str, *, region_name: str) -> _SuccessfulStepFunctionsClient:
         assert service_name == "stepfunctions"
@@ -215,10 +356,10 @@ def test_step_functions_encoded_payload_preserves_discovery_request(
     assert result == {"results": []}
     assert len(requests) == 1
     request = requests[0]
-    wrapper = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
+    wrapper = json_object(request.content)
     encoded_payload = wrapper.get("encoded_payload")
     assert isinstance(encoded_payload, str)
-    content = cast(dict[str, object], json.loads(base64.b64decode(encoded_payload).decode("utf-8")))
+    content = recommendation_request(base64.b64decode(encoded_payload))
     assert content.get("target_schema") == "gc"
     assert content.get("external_version_number") == EXTERNAL_VERSION_NUMBER
     assert content.get("columns") == columns
@@ -303,14 +444,7 @@ async def test_discover_mapping_from_tabular_async(
     """Async variant yields the same structure as the sync function."""
 
     # Given: the recommendation service returns an empty match list for each source column
-    payload = _array_payload(
-        [
-            {"column_name": "a", "matches": []},
-            {"column_name": "b", "matches": []},
-            {"column_name": "c", "matches": []},
-        ]
-    )
-    capture = json_success(payload)
+    capture = json_success(_UNMATCHED_ABC_PAYLOAD)
     install_mock_transport(monkeypatch, capture)
     assert capture.requests == []
 
@@ -333,14 +467,7 @@ def test_discover_mapping_from_tabular_sends_top_k_parameter(
     """Verify top_k parameter is included in the request payload."""
 
     # Given: a discovery response that succeeds for the source columns
-    payload = _array_payload(
-        [
-            {"column_name": "a", "matches": []},
-            {"column_name": "b", "matches": []},
-            {"column_name": "c", "matches": []},
-        ]
-    )
-    capture = json_success(payload)
+    capture = json_success(_UNMATCHED_ABC_PAYLOAD)
     install_mock_transport(monkeypatch, capture)
     assert capture.requests == []
 
@@ -354,8 +481,7 @@ def test_discover_mapping_from_tabular_sends_top_k_parameter(
 
     # Then: the outbound recommendation request includes that top_k choice
     request = capture.requests[0]
-    content = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
-    assert content.get("top_k") == 5
+    assert recommendation_request(request.content).get("top_k") == 5
 
 
 def test_discover_mapping_from_tabular_returns_column_keyed_manifest(
@@ -413,8 +539,7 @@ def test_discover_mapping_from_tabular_returns_column_keyed_manifest(
 
     # And: the outbound recommendation request still preserves user-visible headers
     request = capture.requests[0]
-    content = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
-    columns = cast(list[dict[str, object]], content["columns"])
+    columns = recommendation_request(request.content)["columns"]
     assert [column["column_name"] for column in columns] == ["name", "name", "note"]
 
 
@@ -461,8 +586,7 @@ def test_positional_parity_empty_column_preserved_and_mismatch_detected(
 
     # And: the outbound request preserved the empty-value column at position 1
     request = capture.requests[0]
-    content = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
-    columns_section = cast(list[dict[str, object]], content.get("columns", []))
+    columns_section = recommendation_request(request.content)["columns"]
     assert len(columns_section) == 3
     assert columns_section[1] == {"column_name": "b", "values": []}
 
@@ -513,8 +637,7 @@ def test_blank_header_column_is_preserved_by_position(
 
     # Then: the blank header is sent and mapped back through its list position
     request = capture.requests[0]
-    content = cast(dict[str, object], json.loads(request.content.decode("utf-8")))
-    columns_section = cast(list[dict[str, object]], content.get("columns", []))
+    columns_section = recommendation_request(request.content)["columns"]
     assert [entry["column_name"] for entry in columns_section] == ["a", "", "c"]
     assert columns_section[1]["values"] == ["2", "5"]
 
@@ -840,3 +963,52 @@ def test_discovery_strict_rejects_response_missing_harmonization(
 
     # Then: the client fails loudly instead of defaulting the missing domain field
     assert "harmonization" in str(exc.value)
+
+
+def test_collect_column_samples_pads_short_rows_and_drops_blank_cells() -> None:
+    """Ragged rows are padded per column and whitespace-only cells are skipped.
+
+    'why': samples are built by transposing rows; short rows must not shift or
+    truncate other columns, and extra trailing cells must be ignored.
+    """
+
+    # Given: a short row, a long row, and whitespace padding
+    rows = [[" a ", "b"], ["c"], ["", " d ", "e", "extra"]]
+
+    # When: samples are collected for three columns
+    samples = _collect_column_samples(rows, 3)
+
+    # Then: each column keeps only its own stripped, non-empty values
+    assert samples == [["a", "c"], ["b", "d"], ["e"]]
+    assert _collect_column_samples([], 2) == [[], []]
+
+
+@pytest.mark.parametrize(
+    ("cde_id", "confidence", "expected_cde_id", "expected_confidence"),
+    [
+        (900, 0.5, 900, 0.5),
+        (900.0, 1, 900, 1.0),
+        (True, False, None, None),
+        ("900", "0.5", None, None),
+    ],
+)
+def test_option_numeric_fields_keep_exact_types_and_reject_bools(
+    cde_id: object, confidence: object, expected_cde_id: int | None, expected_confidence: float | None
+) -> None:
+    """Exact int/float values pass straight through; floats and ints are normalized; bools are rejected."""
+
+    # Given: a match whose numeric fields use the given JSON types
+    match: dict[str, object] = {
+        "target": "x",
+        "target_cde_id": cde_id,
+        "confidence": confidence,
+        "harmonization": "harmonizable",
+    }
+
+    # When: the option is parsed
+    option = _option_from_mapping(match)
+
+    # Then: values are normalized to the declared types
+    assert option.target_cde_id == expected_cde_id
+    assert option.confidence == expected_confidence
+    assert type(option.confidence) in (float, type(None))
@@ -4,10 +4,11 @@
 """
 from __future__ import annotations
 
+import asyncio
 import gzip
 import json
 from pathlib import Path
-from typing import cast
+from typing import Final, cast
 
 import httpx
 import pytest
@@ -16,9 +17,22 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from netrias_client import ColumnKeyedManifestPayload, NetriasClient
 from netrias_client._errors import NetriasAPIUnavailable
+from netrias_client._http import build_harmonize_payload, submit_harmonize_job
 from netrias_client._models import HarmonizationResult
+from netrias_client._serialization import loads
+from netrias_client._tabular import read_tabular
 
-from ._utils import EXTERNAL_VERSION_NUMBER, install_mock_transport, job_success, json_failure, transport_error
+from ._utils import (
+    EXTERNAL_VERSION_NUMBER,
+    install_mock_transport,
+    job_success,
+    json_failure,
+    json_success,
+    transport_error,
+)
+
+_CSV_CHUNKS: Final[tuple[bytes, ...]] = (b"col1,col2\n", b"7,8\n")
+_CSV_BYTES: Final[bytes] = b"".join(_CSV_CHUNKS)
 
 
 def _active_sheet(workbook: Workbook) -> Worksheet:
@@ -45,7 +59,7 @@ def test_harmonize_streaming_success(
     """Write harmonized output and return a success result when the API streams CSV bytes."""
 
     # Given: a harmonization client with a successful streaming API response
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     install_mock_transport(monkeypatch, capture)
     expected_output = output_directory / "sample.harmonized.csv"
     assert not expected_output.exists()
@@ -65,7 +79,7 @@ def test_harmonize_streaming_success(
     assert result.file_path == expected_output
     assert result.job_id == "job-123"
     assert expected_output.exists()
-    assert expected_output.read_text(encoding="utf-8") == "col1,col2\n7,8\n"
+    assert expected_output.read_bytes() == _CSV_BYTES
     assert len(capture.requests) == 3
     submit_request = capture.requests[0]
     poll_request = capture.requests[1]
@@ -158,7 +172,7 @@ def test_harmonize_accepts_manifest_mapping(
     """Allow callers to provide manifest data without writing a file."""
 
     # Given: a manifest mapping supplied directly by the caller
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     install_mock_transport(monkeypatch, capture)
     expected_output = output_directory / "sample.harmonized.csv"
     assert not expected_output.exists()
@@ -294,6 +308,7 @@ def test_harmonize_writes_manifest_when_requested(
     configured_client: NetriasClient,
     sample_csv_path: Path,
     sample_manifest_mapping: dict[str, object],
+    sample_manifest_written_bytes: bytes,
     output_directory: Path,
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -301,7 +316,7 @@ def test_harmonize_writes_manifest_when_requested(
     """Persist manifest data to disk when a destination path is supplied."""
 
     # Given: a manifest mapping and a requested manifest output path
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     install_mock_transport(monkeypatch, capture)
 
     manifest_output = tmp_path / "manifest.json"
@@ -319,9 +334,7 @@ def test_harmonize_writes_manifest_when_requested(
     )
 
     # Then: the client writes the input manifest mapping to that path
-    assert manifest_output.exists()
-    loaded = cast(dict[str, object], json.loads(manifest_output.read_text(encoding="utf-8")))
-    assert loaded == sample_manifest_mapping
+    assert manifest_output.read_bytes() == sample_manifest_written_bytes
 
 
 def test_harmonize_downloads_manifest_from_status_payload(
@@ -336,7 +349,7 @@ def test_harmonize_downloads_manifest_from_status_payload(
     # Given: a completed job that exposes a manifest artifact URL whose filename should not be trusted
     manifest_url = "https://mock.netrias/sample.csv"
     capture = job_success(
-        chunks=(b"col1,col2\n", b"7,8\n"),
+        chunks=_CSV_CHUNKS,
         manifest_url=manifest_url,
         manifest_chunks=(b"PAR1",),
     )
@@ -373,7 +386,7 @@ def test_harmonize_recovers_from_transient_status_polling_failures(
     """Keep polling when the status endpoint briefly fails while the job is still running."""
 
     # Given: a queued job whose status endpoint briefly returns retryable failures
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     status_calls = _install_status_poll_sequence(
         monkeypatch,
         httpx.Response(500, json={"message": "temporary backend error"}),
@@ -399,7 +412,7 @@ def test_harmonize_recovers_from_transient_status_polling_failures(
     # Then: transient polling failures do not fail the completed backend job
     assert result.status == "succeeded"
     assert result.job_id == "job-123"
-    assert expected_output.read_text(encoding="utf-8") == "col1,col2\n7,8\n"
+    assert expected_output.read_bytes() == _CSV_BYTES
     assert status_calls == ["job-123", "job-123", "job-123", "job-123"]
     assert len(sleep_durations) == 3
 
@@ -414,7 +427,7 @@ def test_harmonize_keeps_terminal_job_failure_authoritative_after_status_retry(
     """Return the terminal job failure even when an earlier status poll was transiently unavailable."""
 
     # Given: a status endpoint that recovers and reports the backend job failed
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     status_calls = _install_status_poll_sequence(
         monkeypatch,
         httpx.Response(500, json={"message": "temporary backend error"}),
@@ -454,7 +467,7 @@ def test_harmonize_can_disable_cache(
     """Send use_cache=false when callers disable cache use."""
 
     # Given: a harmonization request that has not been submitted yet
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     install_mock_transport(monkeypatch, capture)
     assert capture.requests == []
 
@@ -484,7 +497,7 @@ async def test_harmonize_async_success(
     """Async client method returns a successful result."""
 
     # Given: an async harmonization client with a successful streaming API response
-    capture = job_success(chunks=(b"col1,col2\n", b"7,8\n"))
+    capture = job_success(chunks=_CSV_CHUNKS)
     install_mock_transport(monkeypatch, capture)
     expected_output = output_directory / "sample.harmonized.csv"
     assert not expected_output.exists()
@@ -506,9 +519,72 @@ async def test_harmonize_async_success(
     assert expected_output.exists()
 
 
+def test_harmonize_payload_is_deterministic_and_recompresses_near_cap(
+    sample_csv_path: Path,
+    sample_manifest_mapping: dict[str, object],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Payload bytes are stable per input, and the cap check retries at maximum compression.
+
+    'why': the fast compression level must never reject a payload the stronger level fits
+    """
+
+    # Given: the payload built twice from the same inputs
+    first = build_harmonize_payload(
+        sample_csv_path, sample_manifest_mapping, "ccdi", external_version_number=EXTERNAL_VERSION_NUMBER
+    )
+    second = build_harmonize_payload(
+        sample_csv_path, sample_manifest_mapping, "ccdi", external_version_number=EXTERNAL_VERSION_NUMBER
+    )
+    raw = gzip.decompress(first)
+    strongest = gzip.compress(raw, compresslevel=9, mtime=0)
+
+    # When: the cap sits exactly at the maximum-compression size
+    monkeypatch.setattr("netrias_client._http.MAX_COMPRESSED_BYTES", len(strongest))
+    capped = build_harmonize_payload(
+        sample_csv_path, sample_manifest_mapping, "ccdi", external_version_number=EXTERNAL_VERSION_NUMBER
+    )
+
+    # Then: output is byte-identical across calls and still accepted under the tighter cap
+    assert first == second
+    assert gzip.decompress(capped) == raw
+    assert len(capped) <= len(strongest)
+
+
+def test_harmonize_payload_streams_rows_in_batches_as_compact_json(
+    sample_csv_path: Path,
+    sample_manifest_mapping: dict[str, object],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batched row encoding splices into one valid, compact JSON envelope.
+
+    'why': rows are encoded piecewise into the compressor, so batch seams must not
+    drop, duplicate, or mis-delimit rows
+    """
+
+    # Given: a batch size small enough to split the sample rows across several batches
+    monkeypatch.setattr("netrias_client._http.ROW_ENCODE_BATCH_SIZE", 1)
+    dataset = read_tabular(sample_csv_path)
+    assert len(dataset.rows) > 1
+
+    # When: the payload is built
+    payload = build_harmonize_payload(
+        sample_csv_path, sample_manifest_mapping, "ccdi", external_version_number=EXTERNAL_VERSION_NUMBER
+    )
+
+    # Then: the envelope is compact JSON with every row in order and the manifest attached
+    raw = gzip.decompress(payload)
+    body = cast(dict[str, object], json.loads(raw))
+    assert raw == json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    document = cast(dict[str, object], body["document"])
+    assert document["header"] == dataset.headers
+    assert document["rows"] == dataset.rows
+    assert "column_mappings" in body
+
+
 def _decode_submit_body(request: httpx.Request) -> dict[str, object]:
     raw = gzip.decompress(request.content)
-    return cast(dict[str, object], json.loads(raw.decode("utf-8")))
+    return cast(dict[str, object], loads(raw))
 
 
 def _install_status_poll_sequence(
@@ -547,3 +623,25 @@ def _skip_polling_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
 
     monkeypatch.setattr("netrias_client._core.asyncio.sleep", fake_sleep)
     return durations
+
+
+def test_submit_sends_idempotency_key_only_when_supplied(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Submit carries an Idempotency-Key only when the caller provides one.
+
+    'why': a content-derived default would let the server dedupe deliberate re-runs
+    """
+
+    # Given: a transport that accepts every submission
+    capture = json_success({"jobId": "job-123"}, status_code=202)
+    install_mock_transport(monkeypatch, capture)
+
+    async def _submit(key: str | None) -> None:
+        _ = await submit_harmonize_job("https://example.com", "token", b"payload", 5.0, idempotency_key=key)
+
+    # When: the same payload is submitted without and then with an explicit key
+    asyncio.run(_submit(None))
+    asyncio.run(_submit("caller-key"))
+
+    # Then: only the explicit submission carries the header
+    assert "Idempotency-Key" not in capture.requests[0].headers
+    assert capture.requests[1].headers["Idempotency-Key"] == "caller-key"
@@ -1,9 +1,13 @@
 """Verify public model compatibility contracts."""
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
-from netrias_client._models import HarmonizationResult
+import pytest
+
+from netrias_client._config import build_settings
+from netrias_client._models import HarmonizationResult, MappingDiscoveryResult, MappingSuggestion
 
 
 def test_harmonization_result_preserves_mapping_id_positional_slot(tmp_path: Path) -> None:
@@ -18,3 +22,36 @@ def test_harmonization_result_preserves_mapping_id_positional_slot(tmp_path: Pat
     # Then: that value still belongs to mapping_id, not the newer job_id field
     assert result.mapping_id == "mapping-123"
     assert result.job_id is None
+
+
+def test_settings_snapshot_is_slotted_and_keeps_masked_repr() -> None:
+    """Settings stays immutable without a per-instance __dict__ and still masks the key.
+
+    'why': the client hands out the stored instance directly, so immutability must be
+    enforced by the type rather than by copying
+    """
+
+    # Given: settings built through the normal validation path
+    settings = build_settings(api_key="abcdefghijkl")
+
+    # Then: no instance dict exists, fields cannot be reassigned, and the key is masked
+    assert not hasattr(settings, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        settings.timeout = 1.0  # pyright: ignore[reportAttributeAccessIssue]
+    assert "abcdefghijkl" not in repr(settings)
+
+
+def test_discovery_results_are_slotted() -> None:
+    """Discovery result containers carry no per-instance __dict__.
+
+    'why': wide schemas produce one suggestion per column, so per-instance overhead
+    scales with the dataset
+    """
+
+    # Given: a suggestion nested inside a discovery result
+    suggestion = MappingSuggestion(source_column="age", options=())
+    result = MappingDiscoveryResult(schema="gc", suggestions=(suggestion,), raw={})
+
+    # Then: neither instance allocates an attribute dict
+    assert not hasattr(suggestion, "__dict__")
+    assert not hasattr(result, "__dict__")
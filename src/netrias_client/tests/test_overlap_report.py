@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, patch
 import pandas as pd
 import pytest
 
+from netrias_client import overlap_report
 from netrias_client._models import ColumnKeyedManifestPayload, DataModelStoreEndpoints, LogLevel, Settings
 from netrias_client._tabular import TabularDataset, read_tabular
 from netrias_client.overlap_report import run_overlap_analysis
@@ -134,8 +135,9 @@ async def test_writes_json_and_csv(
 ) -> None:
     """Overlap report writes both JSON and CSV files to the output directory."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -164,8 +166,9 @@ async def test_skips_non_harmonizable_columns(
 ) -> None:
     """Columns with harmonization other than 'harmonizable' are excluded from the report."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -197,8 +200,9 @@ async def test_matched_and_unmatched_counts(
 ) -> None:
     """Matched and unmatched values are counted correctly for both distinct and total."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -235,8 +239,9 @@ async def test_blank_handling(
 ) -> None:
     """Blank, empty, and whitespace-only values count as missing."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -269,8 +274,9 @@ async def test_match_rates(
 ) -> None:
     """Both match rates are between 0 and 1 and excluding_nulls >= including_nulls."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -306,8 +312,9 @@ async def test_csv_includes_all_distinct_values(
 ) -> None:
     """CSV output includes both matched and unmatched values with in_pv_set flag."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -338,8 +345,9 @@ async def test_status_column_uses_correct_pvs(
 ) -> None:
     """Each column fetches and compares against its own CDE's PV set."""
 
-    with patch(
-        "netrias_client.overlap_report.get_pv_set_async",
+    with patch.object(
+        overlap_report,
+        "get_pv_set_async",
         new_callable=AsyncMock,
         side_effect=_mock_pv_lookup(race_pvs, status_pvs),
     ):
@@ -5,13 +5,15 @@
 from __future__ import annotations
 
 import os
+import stat
 from pathlib import Path
+from typing import NoReturn
 
 import pytest
 
 from netrias_client import NetriasClient
 from netrias_client._errors import FileValidationError, OutputLocationError
-from netrias_client._validators import HARD_MAX_CSV_BYTES
+from netrias_client._validators import HARD_MAX_CSV_BYTES, next_available_path
 
 from ._utils import EXTERNAL_VERSION_NUMBER
 
@@ -111,12 +113,15 @@ def test_source_file_too_large(
     'why': avoid uploading files the API will reject for size reasons
     """
 
-    def fake_getsize(path: Path) -> int:
-        if path == sample_csv_path:
-            return HARD_MAX_CSV_BYTES + 1
-        return os.path.getsize(path)
+    def fake_stat(path: Path) -> os.stat_result:
+        result = os.stat(path)
+        if path != sample_csv_path:
+            return result
+        fields = list(result)
+        fields[stat.ST_SIZE] = HARD_MAX_CSV_BYTES + 1
+        return os.stat_result(fields)
 
-    monkeypatch.setattr("netrias_client._validators.os.path.getsize", fake_getsize)
+    monkeypatch.setattr("netrias_client._validators._stat", fake_stat)
 
     # Given a CSV that appears larger than the limit
     # When harmonize executes
@@ -227,7 +232,7 @@ def test_output_path_existing_file_versioned(
     from ._utils import install_mock_transport, job_success
 
     existing = output_directory / "sample.harmonized.csv"
-    _ = existing.write_text("old data", encoding="utf-8")
+    _ = existing.write_bytes(b"old data")
 
     capture = job_success(chunks=(b"col1,col2\n", b"1,2\n"))
     install_mock_transport(monkeypatch, capture)
@@ -244,11 +249,62 @@ def test_output_path_existing_file_versioned(
     assert result.status == "succeeded"
     assert result.file_path == expected_new
     assert expected_new.exists()
-    assert expected_new.read_text(encoding="utf-8") == "col1,col2\n1,2\n"
-    assert existing.read_text(encoding="utf-8") == "old data"
+    assert expected_new.read_bytes() == b"col1,col2\n1,2\n"
+    assert existing.read_bytes() == b"old data"
     assert len(capture.requests) == 3
 
 
+def test_next_available_path_skips_taken_versions(tmp_path: Path) -> None:
+    """Pick the first free `.vN` sibling when earlier versions already exist."""
+
+    # Given the base output and its first two versions on disk
+    candidate = tmp_path / "sample.harmonized.csv"
+    for name in ("sample.harmonized.csv", "sample.harmonized.v1.csv", "sample.harmonized.v2.csv"):
+        _ = (tmp_path / name).write_text("old data", encoding="utf-8")
+
+    # When the next available path is resolved
+    resolved = next_available_path(candidate)
+
+    # Then the first unused version is chosen
+    assert resolved == tmp_path / "sample.harmonized.v3.csv"
+
+
+def test_next_available_path_keeps_case_distinct_names_on_case_sensitive_fs(tmp_path: Path) -> None:
+    """A sibling differing only in case does not block a version on a case-sensitive filesystem."""
+
+    # Given the base output and a differently-cased first version
+    candidate = tmp_path / "sample.harmonized.csv"
+    _ = candidate.write_bytes(b"old data")
+    _ = (tmp_path / "Sample.harmonized.v1.csv").write_bytes(b"other data")
+    if (tmp_path / "SAMPLE.HARMONIZED.CSV").exists():
+        pytest.skip("filesystem is case-insensitive")
+
+    # When / Then the lowercase first version is still available
+    assert next_available_path(candidate) == tmp_path / "sample.harmonized.v1.csv"
+
+
+def test_next_available_path_probes_when_directory_is_unlistable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Fall back to per-path probes when the directory cannot be listed.
+
+    'why': write+search-only drop directories permit stat but not readdir
+    """
+
+    # Given an existing output and first version in a directory that refuses listing
+    candidate = tmp_path / "sample.harmonized.csv"
+    for name in ("sample.harmonized.csv", "sample.harmonized.v1.csv"):
+        _ = (tmp_path / name).write_bytes(b"old data")
+
+    def refuse_listing(path: Path) -> NoReturn:
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr("netrias_client._validators._scandir", refuse_listing)
+
+    # When / Then versioning still finds the next free name
+    assert next_available_path(candidate) == tmp_path / "sample.harmonized.v2.csv"
+
+
 def test_output_directory_must_be_writable(
     configured_client: NetriasClient,
     sample_csv_path: Path,
@@ -264,11 +320,9 @@ def test_output_directory_must_be_writable(
     parent = output_directory
 
     def fake_access(path: Path, mode: int) -> bool:
-        if path == parent and mode == os.W_OK:
-            return False
-        return os.access(path, mode)
+        return not (path == parent and mode == os.W_OK)
 
-    monkeypatch.setattr("netrias_client._validators.os.access", fake_access)
+    monkeypatch.setattr("netrias_client._validators._access", fake_access)
 
     target = output_directory / "custom.csv"
 